@@ -0,0 +1,36 @@
+"""add_contribution_timeline_indexes
+
+Revision ID: c4e8a1d2f7b3
+Revises: b9259fcc3746
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'c4e8a1d2f7b3'
+down_revision: Union[str, None] = 'b9259fcc3746'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covering index for the recent-contributions timeline
+    # (WHERE user_id = ? ORDER BY submitted_at DESC LIMIT n) so it is an index-only scan
+    op.create_index(
+        'ix_contributions_user_submitted',
+        'contributions',
+        ['user_id', sa.text('submitted_at DESC')],
+        postgresql_include=['issue_id', 'status', 'pr_url', 'merged_at'],
+    )
+    # Composite index for the expired/expiring claim scans
+    op.create_index(
+        'ix_issues_status_claim_expires_at',
+        'issues',
+        ['status', 'claim_expires_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_issues_status_claim_expires_at', table_name='issues')
+    op.drop_index('ix_contributions_user_submitted', table_name='contributions')
@@ -0,0 +1,29 @@
+"""add_claimed_issue_partial_index
+
+Revision ID: d7f2b9e4a150
+Revises: c4e8a1d2f7b3
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'd7f2b9e4a150'
+down_revision: Union[str, None] = 'c4e8a1d2f7b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Partial index covering only live claims, so the hourly expired-claim
+    # scan is a small range scan instead of a filter over the whole table
+    op.create_index(
+        'ix_issues_claimed_expires_at',
+        'issues',
+        ['claim_expires_at'],
+        postgresql_where=sa.text("status = 'CLAIMED' AND claim_expires_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_issues_claimed_expires_at', table_name='issues')
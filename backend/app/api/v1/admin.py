@@ -39,12 +39,15 @@ def get_admin_user(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
+def get_admin_service(db: Session = Depends(get_db)) -> AdminService:
+    return AdminService(db)
+
+
 @router.get("/stats", response_model=PlatformStats)
 def get_platform_statistics(
     admin_user: User = Depends(get_admin_user),
-    db: Session = Depends(get_db)
+    admin_service: AdminService = Depends(get_admin_service)
 ):
-    admin_service = AdminService(db)
     return admin_service.get_platform_stats()
 
 
@@ -54,9 +57,8 @@ def get_repositories(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     admin_user: User = Depends(get_admin_user),
-    db: Session = Depends(get_db)
+    admin_service: AdminService = Depends(get_admin_service)
 ):
-    admin_service = AdminService(db)
     repositories, total = admin_service.get_repositories(
         active_only=active_only, page=page, page_size=page_size
     )
@@ -73,9 +75,8 @@ def get_repositories(
 async def add_repository(
     repository: RepositoryCreate,
     admin_user: User = Depends(get_admin_user),
-    db: Session = Depends(get_db)
+    admin_service: AdminService = Depends(get_admin_service)
 ):
-    admin_service = AdminService(db)
     try:
         new_repo = await admin_service.add_repository(repository.full_name)
         return RepositoryManagement(
@@ -93,9 +94,9 @@ def update_repository(
     repo_id: int,
     update: RepositoryUpdate,
     admin_user: User = Depends(get_admin_user),
+    admin_service: AdminService = Depends(get_admin_service),
     db: Session = Depends(get_db)
 ):
-    admin_service = AdminService(db)
     try:
         updated_repo = admin_service.update_repository(repo_id, update.is_active)
         from app.models.issue import Issue
@@ -115,9 +116,8 @@ def update_repository(
 def delete_repository(
     repo_id: int,
     admin_user: User = Depends(get_admin_user),
-    db: Session = Depends(get_db)
+    admin_service: AdminService = Depends(get_admin_service)
 ):
-    admin_service = AdminService(db)
     try:
         admin_service.delete_repository(repo_id)
         return None
@@ -148,9 +148,8 @@ def get_users(
     page_size: int = Query(20, ge=1, le=100),
     admin_only: bool = Query(False),
     admin_user: User = Depends(get_admin_user),
-    db: Session = Depends(get_db)
+    admin_service: AdminService = Depends(get_admin_service)
 ):
-    admin_service = AdminService(db)
     users, total = admin_service.get_users(page=page, page_size=page_size, admin_only=admin_only)
     return {
         "users": users, "total": total, "page": page,
@@ -163,9 +162,9 @@ def update_user_role(
     user_id: int,
     role_update: UserRoleUpdate,
     admin_user: User = Depends(get_admin_user),
+    admin_service: AdminService = Depends(get_admin_service),
     db: Session = Depends(get_db)
 ):
-    admin_service = AdminService(db)
     try:
         updated_user = admin_service.update_user_role(user_id, role_update.is_admin)
         from app.models.issue import Issue, IssueStatus
@@ -187,18 +186,16 @@ def update_user_role(
 @router.get("/health", response_model=SystemHealth)
 async def check_system_health(
     admin_user: User = Depends(get_admin_user),
-    db: Session = Depends(get_db),
+    admin_service: AdminService = Depends(get_admin_service),
 ):
-    admin_service = AdminService(db)
     return await admin_service.check_system_health()
 
 
 @router.get("/config", response_model=ConfigurationSettings)
 def get_configuration(
     admin_user: User = Depends(get_admin_user),
-    db: Session = Depends(get_db)
+    admin_service: AdminService = Depends(get_admin_service)
 ):
-    admin_service = AdminService(db)
     return admin_service.get_configuration()
 
 
@@ -206,9 +203,8 @@ def get_configuration(
 def update_configuration(
     config_update: ConfigurationUpdate,
     admin_user: User = Depends(get_admin_user),
-    db: Session = Depends(get_db)
+    admin_service: AdminService = Depends(get_admin_service)
 ):
-    admin_service = AdminService(db)
     updates = config_update.model_dump(exclude_none=True)
     return admin_service.update_configuration(updates)
 
@@ -216,7 +212,6 @@ def update_configuration(
 @router.get("/rate-limit", response_model=RateLimitStatus)
 async def get_rate_limit_status(
     admin_user: User = Depends(get_admin_user),
-    db: Session = Depends(get_db)
+    admin_service: AdminService = Depends(get_admin_service)
 ):
-    admin_service = AdminService(db)
     return await admin_service.get_rate_limit_status()
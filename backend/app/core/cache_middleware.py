@@ -2,11 +2,9 @@
 API response caching middleware for FastAPI.
 """
 import hashlib
-import json
 from typing import Callable
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
 
 from app.services.cache_service import cache_service
 
@@ -57,49 +55,42 @@ class ResponseCacheMiddleware(BaseHTTPMiddleware):
         # Generate cache key from request
         cache_key = self._generate_cache_key(request)
         
-        # Try to get cached response
+        # Try to get cached response. Bodies are cached as the raw encoded
+        # bytes, so hits and misses skip JSON decoding and re-encoding.
         cached_response = cache_service.get(cache_key)
         if cached_response:
-            return JSONResponse(
-                content=cached_response["content"],
+            return Response(
+                content=cached_response["body"],
                 status_code=cached_response["status_code"],
+                media_type="application/json",
                 headers={"X-Cache": "HIT"}
             )
         
         # Process request
         response = await call_next(request)
         
-        # Only cache successful responses
-        if response.status_code == 200:
+        # Only cache successful JSON responses
+        content_type = response.headers.get("content-type", "")
+        if response.status_code == 200 and content_type.startswith("application/json"):
             # Read response body
             response_body = b""
             async for chunk in response.body_iterator:
                 response_body += chunk
             
-            try:
-                # Parse JSON response
-                content = json.loads(response_body.decode())
-                
-                # Cache the response
-                cache_data = {
-                    "content": content,
-                    "status_code": response.status_code
-                }
-                cache_service.set(cache_key, cache_data, ttl)
-                
-                # Return new response with cached data
-                return JSONResponse(
-                    content=content,
-                    status_code=response.status_code,
-                    headers={"X-Cache": "MISS"}
-                )
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                # If response is not JSON, return as-is
-                return Response(
-                    content=response_body,
-                    status_code=response.status_code,
-                    headers=dict(response.headers)
-                )
+            # Cache the response
+            cache_data = {
+                "body": response_body,
+                "status_code": response.status_code
+            }
+            cache_service.set(cache_key, cache_data, ttl)
+            
+            headers = dict(response.headers)
+            headers["X-Cache"] = "MISS"
+            return Response(
+                content=response_body,
+                status_code=response.status_code,
+                headers=headers
+            )
         
         return response
     
@@ -2,11 +2,16 @@
 Input validation and sanitization utilities for security hardening.
 """
 import re
+from functools import lru_cache
 from typing import Any, Optional
 from urllib.parse import urlparse
 import html
 import bleach
 
+# Distinct values remembered per pure validator; the same usernames, repos and
+# URLs are validated on request after request
+VALIDATION_CACHE_SIZE = 8192
+
 
 class InputValidator:
     """Comprehensive input validation and sanitization."""
@@ -78,6 +83,7 @@ class InputValidator:
         return cleaned
     
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_github_username(username: str) -> str:
         """
         Validate and sanitize GitHub username.
@@ -102,6 +108,7 @@ class InputValidator:
         return username
     
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_github_repo(repo_name: str) -> str:
         """
         Validate GitHub repository name (owner/repo format).
@@ -125,6 +132,7 @@ class InputValidator:
         return repo_name
     
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_github_url(url: str) -> str:
         """
         Validate GitHub issue or PR URL.
@@ -148,6 +156,7 @@ class InputValidator:
         return url
     
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_email(email: str) -> str:
         """
         Validate email address.
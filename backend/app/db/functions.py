@@ -0,0 +1,29 @@
+"""
+Portable SQL expressions that need dialect-specific rendering.
+"""
+from sqlalchemy import Float
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class hours_until(FunctionElement):
+    """
+    Hours from the database clock's now() until a timestamp column.
+
+    Negative when the timestamp is in the past.
+    """
+    type = Float()
+    name = "hours_until"
+    inherit_cache = True
+
+
+@compiles(hours_until)
+def _compile_hours_until(element, compiler, **kw):
+    (column,) = list(element.clauses)
+    return "EXTRACT(EPOCH FROM (%s - now())) / 3600.0" % compiler.process(column, **kw)
+
+
+@compiles(hours_until, "sqlite")
+def _compile_hours_until_sqlite(element, compiler, **kw):
+    (column,) = list(element.clauses)
+    return "(julianday(%s) - julianday('now')) * 24.0" % compiler.process(column, **kw)
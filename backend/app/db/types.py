@@ -0,0 +1,21 @@
+"""
+Column types that map to the closest native type on each dialect.
+"""
+from sqlalchemy import JSON, String
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.types import TypeDecorator
+
+
+class ArrayOrJSON(TypeDecorator):
+    """
+    List of strings: a native ``VARCHAR[]`` on PostgreSQL, JSON elsewhere.
+
+    Lets the models run unchanged against SQLite in tests.
+    """
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.ARRAY(String))
+        return dialect.type_descriptor(JSON())
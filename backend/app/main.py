@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
@@ -73,6 +75,19 @@ async def health_check():
     return {"status": "healthy"}
 
 
+async def _purge_expired_cache(interval_seconds: int = 60):
+    """Sweep expired cache keys off the event loop at a fixed interval."""
+    from app.services.cache_service import cache_service
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            purged = await asyncio.to_thread(cache_service.purge_expired)
+            if purged:
+                logger.debug(f"Purged {purged} expired cache keys")
+        except Exception as e:
+            logger.warning(f"Cache purge failed: {e}")
+
+
 @app.on_event("startup")
 async def startup_event():
     logger.info(
@@ -95,7 +110,19 @@ async def startup_event():
     except Exception as e:
         logger.warning(f"Failed to initialize achievements: {e}")
 
+    # Share cache invalidations across worker processes when Redis is configured
+    from app.services.cache_service import invalidation_bus
+    invalidation_bus.connect()
+
+    # Periodically evict expired in-memory cache entries
+    app.state.cache_purge_task = asyncio.create_task(_purge_expired_cache())
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Application shutting down")
+    purge_task = getattr(app.state, "cache_purge_task", None)
+    if purge_task:
+        purge_task.cancel()
+    from app.services.cache_service import invalidation_bus
+    invalidation_bus.close()
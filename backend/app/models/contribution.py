@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
@@ -36,5 +36,15 @@ class Contribution(Base):
     user = relationship("User", back_populates="contributions")
     issue = relationship("Issue", back_populates="contributions")
 
+    __table_args__ = (
+        # Covering index for the per-user recent contributions timeline
+        Index(
+            "ix_contributions_user_submitted",
+            user_id,
+            submitted_at.desc(),
+            postgresql_include=["issue_id", "status", "pr_url", "merged_at"],
+        ),
+    )
+
     def __repr__(self):
         return f"<Contribution(id={self.id}, user_id={self.user_id}, status='{self.status}')>"
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ARRAY, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Text, ForeignKey, Index, Enum as SQLEnum, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
+from app.db.types import ArrayOrJSON
 import enum
 
 
@@ -22,7 +23,7 @@ class Issue(Base):
     # Issue details
     title = Column(String(500), nullable=False)
     description = Column(Text, nullable=True)
-    labels = Column(ARRAY(String), default=list, nullable=False)
+    labels = Column(ArrayOrJSON, default=list, nullable=False)
     programming_language = Column(String(100), nullable=True, index=True)
     difficulty_level = Column(String(50), nullable=True, index=True)
     
@@ -47,5 +48,16 @@ class Issue(Base):
     claimer = relationship("User", back_populates="claimed_issues", foreign_keys=[claimed_by])
     contributions = relationship("Contribution", back_populates="issue", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Expired/expiring claim scans filter on status then claim_expires_at
+        Index("ix_issues_status_claim_expires_at", status, claim_expires_at),
+        # Partial index limited to live claims for the auto-release scan
+        Index(
+            "ix_issues_claimed_expires_at",
+            claim_expires_at,
+            postgresql_where=text("status = 'CLAIMED' AND claim_expires_at IS NOT NULL"),
+        ),
+    )
+
     def __repr__(self):
         return f"<Issue(id={self.id}, title='{self.title[:50]}...', status='{self.status}')>"
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ARRAY, Text, Boolean
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Text, Boolean
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
+from app.db.types import ArrayOrJSON
 
 
 class Repository(Base):
@@ -15,7 +16,7 @@ class Repository(Base):
     
     # Repository metadata
     primary_language = Column(String(100), nullable=True, index=True)
-    topics = Column(ARRAY(String), default=list, nullable=False)
+    topics = Column(ArrayOrJSON, default=list, nullable=False)
     stars = Column(Integer, default=0, nullable=False)
     forks = Column(Integer, default=0, nullable=False)
     
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, ARRAY, Text, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
+from app.db.types import ArrayOrJSON
 
 
 class User(Base):
@@ -17,8 +18,8 @@ class User(Base):
     location = Column(String(255), nullable=True)
     
     # User preferences stored as arrays
-    preferred_languages = Column(ARRAY(String), default=list, nullable=False)
-    preferred_labels = Column(ARRAY(String), default=list, nullable=False)
+    preferred_languages = Column(ArrayOrJSON, default=list, nullable=False)
+    preferred_labels = Column(ArrayOrJSON, default=list, nullable=False)
     
     # Statistics
     total_contributions = Column(Integer, default=0, nullable=False)
@@ -35,5 +36,9 @@ class User(Base):
     contributions = relationship("Contribution", back_populates="user", cascade="all, delete-orphan")
     claimed_issues = relationship("Issue", back_populates="claimer", foreign_keys="Issue.claimed_by")
 
+    # Fetch server-generated created_at/updated_at via RETURNING on INSERT/UPDATE
+    # so mutations don't need a follow-up refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         return f"<User(id={self.id}, github_username='{self.github_username}')>"
@@ -1,7 +1,7 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, case, insert, select
 from fastapi import HTTPException, status
 
 from app.models.achievement import Achievement, UserAchievement
@@ -13,8 +13,8 @@ from app.schemas.achievement import AchievementCreate, UserAchievementProgress
 class AchievementService:
     """Achievement system for gamification and user milestones"""
     
-    # Predefined achievements
-    ACHIEVEMENTS = [
+    # Predefined achievements, as rows ready for a bulk INSERT
+    ACHIEVEMENTS = (
         {
             "name": "First Steps",
             "description": "Submit your first pull request",
@@ -113,7 +113,7 @@ class AchievementService:
             "category": "language",
             "threshold": 3
         },
-    ]
+    )
     
     def __init__(self, db: Session):
         self.db = db
@@ -124,18 +124,15 @@ class AchievementService:
         
         This should be called during application setup
         """
-        achievements = []
+        existing = set(self.db.scalars(select(Achievement.name)))
+        new_rows = [row for row in self.ACHIEVEMENTS if row["name"] not in existing]
         
-        for achievement_data in self.ACHIEVEMENTS:
-            # Check if achievement already exists
-            existing = self.db.query(Achievement).filter(
-                Achievement.name == achievement_data["name"]
-            ).first()
-            
-            if not existing:
-                achievement = Achievement(**achievement_data)
-                self.db.add(achievement)
-                achievements.append(achievement)
+        achievements = []
+        if new_rows:
+            # One INSERT for every missing definition
+            achievements = list(self.db.scalars(
+                insert(Achievement).returning(Achievement), new_rows
+            ))
         
         self.db.commit()
         return achievements
@@ -152,12 +149,8 @@ class AchievementService:
         - 6.3: Award badges or achievements for milestones
         """
         all_achievements = self.get_all_achievements()
-        user_achievements = self.db.query(UserAchievement).filter(
-            UserAchievement.user_id == user_id
-        ).all()
-        
-        # Create a map of achievement_id to user_achievement
-        user_achievement_map = {ua.achievement_id: ua for ua in user_achievements}
+        user_achievement_map = self._get_user_achievement_map(user_id)
+        counts = None
         
         result = []
         for achievement in all_achievements:
@@ -169,7 +162,9 @@ class AchievementService:
                 earned_at = user_achievement.earned_at if is_unlocked else None
             else:
                 # Calculate current progress
-                progress = self._calculate_achievement_progress(user_id, achievement)
+                if counts is None:
+                    counts = self._get_progress_counts(user_id)
+                progress = self._calculate_achievement_progress(user_id, achievement, counts)
                 is_unlocked = False
                 earned_at = None
             
@@ -195,17 +190,16 @@ class AchievementService:
         Returns list of newly awarded achievements
         """
         all_achievements = self.get_all_achievements()
+        user_achievement_map = self._get_user_achievement_map(user_id)
+        counts = self._get_progress_counts(user_id)
         newly_awarded = []
         
         for achievement in all_achievements:
             # Check if user already has this achievement
-            existing = self.db.query(UserAchievement).filter(
-                UserAchievement.user_id == user_id,
-                UserAchievement.achievement_id == achievement.id
-            ).first()
+            existing = user_achievement_map.get(achievement.id)
             
             # Calculate current progress
-            progress = self._calculate_achievement_progress(user_id, achievement)
+            progress = self._calculate_achievement_progress(user_id, achievement, counts)
             
             if existing:
                 # Update progress
@@ -234,28 +228,68 @@ class AchievementService:
         self.db.commit()
         return newly_awarded
     
-    def _calculate_achievement_progress(self, user_id: int, achievement: Achievement) -> int:
+    def _get_user_achievement_map(self, user_id: int) -> Dict[int, UserAchievement]:
+        """Load all of a user's achievement records keyed by achievement_id"""
+        user_achievements = self.db.query(UserAchievement).filter(
+            UserAchievement.user_id == user_id
+        ).all()
+        return {ua.achievement_id: ua for ua in user_achievements}
+    
+    def _get_progress_counts(self, user_id: int) -> Dict[str, Any]:
+        """
+        Load every counter achievement progress is based on in one query
+        
+        Contributions are grouped by their issue's language; the overall
+        submitted and merged totals are summed from those groups.
+        
+        Requirements:
+        - 6.5: Only count verified and completed contributions
+        """
+        rows = self.db.query(
+            Issue.programming_language,
+            func.count(Contribution.id),
+            func.sum(case((Contribution.status == ContributionStatus.MERGED, 1), else_=0))
+        ).select_from(Contribution).outerjoin(
+            Issue, Contribution.issue_id == Issue.id
+        ).filter(
+            Contribution.user_id == user_id
+        ).group_by(Issue.programming_language).all()
+        
+        submitted = sum(count for _, count, _ in rows)
+        merged = sum(merged or 0 for _, _, merged in rows)
+        languages = {
+            language: count for language, count, _ in rows if language is not None
+        }
+        
+        return {"submitted": submitted, "merged": merged, "languages": languages}
+    
+    def _calculate_achievement_progress(
+        self,
+        user_id: int,
+        achievement: Achievement,
+        counts: Optional[Dict[str, Any]] = None
+    ) -> int:
         """
         Calculate user's progress towards a specific achievement
         
+        ``counts`` comes from _get_progress_counts; pass it when checking
+        several achievements so the counters are loaded only once.
+        
         Requirements:
         - 6.5: Only count verified and completed contributions
         """
+        if counts is None:
+            counts = self._get_progress_counts(user_id)
         category = achievement.category
         
         if category == "milestone":
             # Milestone achievements based on PR counts
             if "merged" in achievement.name.lower() or "merge" in achievement.name.lower():
                 # Count merged PRs
-                return self.db.query(func.count(Contribution.id)).filter(
-                    Contribution.user_id == user_id,
-                    Contribution.status == ContributionStatus.MERGED
-                ).scalar() or 0
+                return counts["merged"]
             else:
                 # Count all submitted PRs
-                return self.db.query(func.count(Contribution.id)).filter(
-                    Contribution.user_id == user_id
-                ).scalar() or 0
+                return counts["submitted"]
         
         elif category == "language":
             # Language-specific achievements
@@ -276,21 +310,11 @@ class AchievementService:
             
             if target_language:
                 # Count contributions in this language
-                return self.db.query(func.count(Contribution.id.distinct())).join(
-                    Issue, Contribution.issue_id == Issue.id
-                ).filter(
-                    Contribution.user_id == user_id,
-                    Issue.programming_language == target_language
-                ).scalar() or 0
+                return counts["languages"].get(target_language, 0)
             
             # Polyglot achievement - count distinct languages
             if achievement.name == "Polyglot":
-                return self.db.query(func.count(func.distinct(Issue.programming_language))).join(
-                    Contribution, Contribution.issue_id == Issue.id
-                ).filter(
-                    Contribution.user_id == user_id,
-                    Issue.programming_language.isnot(None)
-                ).scalar() or 0
+                return len(counts["languages"])
         
         return 0
     
@@ -4,38 +4,65 @@ Replaces Redis for local development and Supabase-based deployments.
 """
 import json
 import time
+import logging
 import threading
-from typing import Optional, Any, List
+from collections import OrderedDict
+from functools import wraps
+from typing import Optional, Any, Awaitable, Callable, List
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for "no live entry", since None is a cacheable value
+_MISSING = object()
 
 
 class InMemoryCache:
     """Thread-safe in-memory cache with TTL support."""
 
+    # Keys examined per lock acquisition during pattern deletes and sweeps,
+    # so a large scan never holds the lock against readers for long.
+    # Bulk removals pop values under the lock and release the references
+    # after it, so freeing large cached payloads never blocks readers.
+    SCAN_BATCH_SIZE = 128
+
     def __init__(self):
         self._store: dict = {}
         self._expiry: dict = {}
         self._lock = threading.Lock()
 
-    def _is_expired(self, key: str) -> bool:
-        if key in self._expiry and self._expiry[key] < time.time():
+    def _get_locked(self, key: str, now: float) -> Any:
+        """
+        Return a live value or _MISSING, evicting it if expired.
+
+        Does one lookup per dict; the caller must hold the lock.
+        """
+        value = self._store.get(key, _MISSING)
+        if value is _MISSING:
+            return _MISSING
+        expires_at = self._expiry.get(key)
+        if expires_at is not None and expires_at < now:
             del self._store[key]
             del self._expiry[key]
-            return True
-        return False
+            return _MISSING
+        return value
+
+    def _set_locked(self, key: str, value: Any, expires_at: Optional[float]) -> None:
+        self._store[key] = value
+        if expires_at is not None:
+            self._expiry[key] = expires_at
+        else:
+            self._expiry.pop(key, None)
 
     def get(self, key: str) -> Optional[Any]:
         with self._lock:
-            if key not in self._store or self._is_expired(key):
-                return None
-            return self._store[key]
+            value = self._get_locked(key, time.time())
+        return None if value is _MISSING else value
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         with self._lock:
-            self._store[key] = value
-            if ttl:
-                self._expiry[key] = time.time() + ttl
-            elif key in self._expiry:
-                del self._expiry[key]
+            self._set_locked(key, value, time.time() + ttl if ttl else None)
             return True
 
     def delete(self, key: str) -> bool:
@@ -45,44 +72,94 @@ class InMemoryCache:
             self._expiry.pop(key, None)
             return removed
 
+    def delete_many(self, *keys: str) -> int:
+        """Delete several keys under a single lock acquisition."""
+        unlinked = []
+        with self._lock:
+            for key in keys:
+                if key in self._store:
+                    unlinked.append(self._store.pop(key))
+                self._expiry.pop(key, None)
+        removed = len(unlinked)
+        unlinked.clear()
+        return removed
+
     def delete_pattern(self, pattern: str) -> int:
         """Delete keys matching a simple prefix pattern (supports trailing *)."""
         prefix = pattern.rstrip("*")
         with self._lock:
-            keys_to_delete = [k for k in self._store if k.startswith(prefix)]
-            for k in keys_to_delete:
-                self._store.pop(k, None)
-                self._expiry.pop(k, None)
-            return len(keys_to_delete)
+            keys = list(self._store)
+        deleted = 0
+        # Walk the snapshot in batches, SCAN-style, re-taking the lock per batch
+        for start in range(0, len(keys), self.SCAN_BATCH_SIZE):
+            unlinked = []
+            with self._lock:
+                for k in keys[start:start + self.SCAN_BATCH_SIZE]:
+                    if k.startswith(prefix) and k in self._store:
+                        unlinked.append(self._store.pop(k))
+                        self._expiry.pop(k, None)
+            deleted += len(unlinked)
+            # UNLINK-style: values are freed here, outside the lock
+            unlinked.clear()
+        return deleted
+
+    def purge_expired(self) -> int:
+        """
+        Evict every expired key.
+
+        Expired entries are otherwise only dropped when read again, so
+        write-once keys (rate-limit windows, per-IP counters) would pile up.
+        """
+        with self._lock:
+            candidates = list(self._expiry.items())
+        now = time.time()
+        expired = [k for k, expires_at in candidates if expires_at < now]
+        purged = 0
+        for start in range(0, len(expired), self.SCAN_BATCH_SIZE):
+            unlinked = []
+            with self._lock:
+                for k in expired[start:start + self.SCAN_BATCH_SIZE]:
+                    # Re-check: the key may have been re-set since the snapshot
+                    expires_at = self._expiry.get(k)
+                    if expires_at is not None and expires_at < now:
+                        del self._expiry[k]
+                        unlinked.append(self._store.pop(k, None))
+            purged += len(unlinked)
+            unlinked.clear()
+        return purged
 
     def exists(self, key: str) -> bool:
         with self._lock:
-            if key not in self._store or self._is_expired(key):
-                return False
-            return True
+            return self._get_locked(key, time.time()) is not _MISSING
 
     def get_many(self, keys: List[str]) -> List[Optional[Any]]:
-        return [self.get(k) for k in keys]
+        """Read several keys under a single lock acquisition."""
+        with self._lock:
+            now = time.time()
+            values = [self._get_locked(k, now) for k in keys]
+        return [None if v is _MISSING else v for v in values]
 
     def set_many(self, mapping: dict, ttl: Optional[int] = None) -> bool:
-        for k, v in mapping.items():
-            self.set(k, v, ttl)
+        """Write several keys under a single lock acquisition."""
+        with self._lock:
+            expires_at = time.time() + ttl if ttl else None
+            for k, v in mapping.items():
+                self._set_locked(k, v, expires_at)
         return True
 
     def increment(self, key: str, amount: int = 1) -> Optional[int]:
         with self._lock:
-            if key not in self._store or self._is_expired(key):
-                self._store[key] = amount
-                return amount
-            self._store[key] = (self._store[key] or 0) + amount
-            return self._store[key]
+            value = self._get_locked(key, time.time())
+            value = amount if value is _MISSING else (value or 0) + amount
+            self._store[key] = value
+            return value
 
     def ttl(self, key: str) -> int:
         with self._lock:
-            if key not in self._expiry:
+            expires_at = self._expiry.get(key)
+            if expires_at is None:
                 return -1
-            remaining = int(self._expiry[key] - time.time())
-            return max(remaining, 0)
+            return max(int(expires_at - time.time()), 0)
 
     def get_ttl(self, key: str) -> Optional[int]:
         val = self.ttl(key)
@@ -142,7 +219,148 @@ class CacheTTL:
     AI_EXPLANATION = DAY
     USER_ACHIEVEMENTS = HOUR
     CONTRIBUTION_TIMELINE = FIFTEEN_MINUTES
+    GITHUB_STATUS = 2 * MINUTE
+
+
+def async_ttl_cache(maxsize: int = 10000, ttl: int = CacheTTL.GITHUB_STATUS):
+    """
+    Memoize an async function's results by positional arguments for ``ttl`` seconds.
+
+    Results are kept process-wide, least recently used first out once
+    ``maxsize`` is reached. None results are cached too; exceptions are not.
+    The wrapped function gains a ``cache_clear()`` method.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        entries: OrderedDict = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(func)
+        async def wrapper(*args):
+            with lock:
+                entry = entries.get(args)
+                if entry is not None and entry[1] > time.monotonic():
+                    entries.move_to_end(args)
+                    return entry[0]
+
+            value = await func(*args)
+            with lock:
+                entries[args] = (value, time.monotonic() + ttl)
+                entries.move_to_end(args)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return value
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+_redis_client = None
+
+
+def get_redis_client():
+    """
+    Return the process-wide Redis client, creating it on first use.
+
+    The client keeps its own connection pool, so callers reuse open
+    connections instead of paying connect/auth setup per call.
+    Returns None when REDIS_URL is not configured.
+    """
+    global _redis_client
+    if _redis_client is None and settings.REDIS_URL:
+        try:
+            import redis
+            _redis_client = redis.Redis.from_url(
+                settings.REDIS_URL,
+                socket_timeout=2,
+                socket_connect_timeout=2,
+                health_check_interval=30
+            )
+        except Exception as e:
+            logger.warning(f"Redis client unavailable: {e}")
+    return _redis_client
+
+
+def reset_redis_client():
+    """Drop the shared Redis client so the next call to get_redis_client reconnects."""
+    global _redis_client
+    client, _redis_client = _redis_client, None
+    if client is not None:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+class CacheInvalidationBus:
+    """
+    Fans key invalidations out to every worker process over Redis pub/sub.
+
+    Each API/worker process keeps its own InMemoryCache, so deleting a key
+    locally leaves stale copies in sibling processes. When REDIS_URL is set,
+    published keys are dropped from every subscribed process's cache.
+    Without Redis the bus is a no-op and only the local cache is touched.
+    """
+
+    CHANNEL = "cache:invalidate"
+
+    def __init__(self, cache: InMemoryCache):
+        self._cache = cache
+        self._client = None
+        self._listener: Optional[threading.Thread] = None
+
+    def connect(self) -> bool:
+        """Subscribe to the invalidation channel on the shared Redis client."""
+        if self._listener is not None:
+            return False
+        client = get_redis_client()
+        if client is None:
+            return False
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self.CHANNEL: self._handle_message})
+            self._listener = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+            self._client = client
+            logger.info("Cache invalidation bus subscribed to Redis")
+            return True
+        except Exception as e:
+            logger.warning(f"Cache invalidation bus disabled: {e}")
+            return False
+
+    @property
+    def connected(self) -> bool:
+        """Whether invalidations are being shared over Redis."""
+        return self._client is not None
+
+    def close(self):
+        """Stop the subscriber thread."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        self._client = None
+
+    def _handle_message(self, message: dict):
+        try:
+            keys = json.loads(message["data"])
+        except (KeyError, TypeError, ValueError):
+            return
+        self._cache.delete_many(*keys)
+
+    def invalidate(self, *keys: str) -> int:
+        """Delete keys locally and broadcast the deletion to other processes."""
+        removed = self._cache.delete_many(*keys)
+        if self._client is not None:
+            try:
+                self._client.publish(self.CHANNEL, json.dumps(keys))
+            except Exception as e:
+                logger.error(f"Cache invalidation publish error: {e}")
+        return removed
 
 
 # Global cache service instance
 cache_service = InMemoryCache()
+invalidation_bus = CacheInvalidationBus(cache_service)
@@ -1,7 +1,7 @@
 """
 Contribution service for PR validation and scoring
 """
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import logging
@@ -11,6 +11,7 @@ from app.models.contribution import Contribution, ContributionStatus
 from app.models.issue import Issue, IssueStatus
 from app.models.user import User
 from app.models.repository import Repository
+from app.services.cache_service import cache_service
 from app.services.github_service import GitHubService
 from app.services.achievement_service import AchievementService
 from app.schemas.contribution import (
@@ -160,7 +161,6 @@ class ContributionService:
             self.db.refresh(contribution)
             
             # Invalidate issue caches so list/detail pages show updated status
-            from app.services.cache_service import cache_service
             cache_service.delete_pattern("issues:*")
             cache_service.delete_pattern("api:response:*")
             cache_service.delete_pattern("user:*")
@@ -232,8 +232,11 @@ class ContributionService:
             True if update was successful
         """
         try:
-            # Find contribution by PR URL or PR number
-            contribution = self.db.query(Contribution).filter(
+            # Find contribution by PR URL or PR number, loading its user in
+            # the same statement for the merge-stats update below
+            contribution = self.db.query(Contribution).options(
+                joinedload(Contribution.user)
+            ).filter(
                 (Contribution.pr_url == pr_url) | (Contribution.pr_number == pr_number)
             ).first()
             
@@ -253,9 +256,8 @@ class ContributionService:
                     contribution.points_earned = self.POINTS_MERGED
                     
                     # Update user statistics
-                    user = self.db.query(User).filter(User.id == contribution.user_id).first()
-                    if user:
-                        user.merged_prs += 1
+                    if contribution.user:
+                        contribution.user.merged_prs += 1
                         
             elif action == "closed" and not merged:
                 contribution.status = ContributionStatus.CLOSED
@@ -264,7 +266,6 @@ class ContributionService:
             self.db.commit()
             
             # Invalidate issue caches
-            from app.services.cache_service import cache_service
             cache_service.delete_pattern("issues:*")
             cache_service.delete_pattern("api:response:*")
             cache_service.delete_pattern("user:*")
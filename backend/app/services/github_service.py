@@ -2,6 +2,7 @@
 GitHub API integration service with rate limiting and error handling
 """
 import httpx
+import re
 import time
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
@@ -54,6 +55,8 @@ class GitHubService:
     """
     
     BASE_URL = "https://api.github.com"
+    GRAPHQL_ENDPOINT = "/graphql"
+    GRAPHQL_BATCH_SIZE = 100
     
     def __init__(self, access_token: Optional[str] = None):
         """
@@ -81,7 +84,8 @@ class GitHubService:
         if self._client is None:
             self._client = httpx.AsyncClient(
                 timeout=30.0,
-                follow_redirects=True
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
             )
         return self._client
     
@@ -144,7 +148,11 @@ class GitHubService:
             AuthenticationError: When authentication fails
             GitHubAPIError: For other API errors
         """
-        await self._check_rate_limit()
+        # GraphQL has its own points budget, separate from the REST core
+        # limit tracked in rate_limit_info, so it neither checks nor updates it
+        is_graphql = endpoint == self.GRAPHQL_ENDPOINT
+        if not is_graphql:
+            await self._check_rate_limit()
         
         client = await self._get_client()
         url = f"{self.BASE_URL}{endpoint}"
@@ -159,7 +167,8 @@ class GitHubService:
             )
             
             # Update rate limit info
-            self._update_rate_limit(response)
+            if not is_graphql:
+                self._update_rate_limit(response)
             
             # Handle different status codes
             if response.status_code == 200:
@@ -350,7 +359,6 @@ class GitHubService:
             linked_issue = None
             if pr.body:
                 # Look for common patterns: "Fixes #123", "Closes #123", etc.
-                import re
                 issue_patterns = [
                     r"(?:fix|fixes|fixed|close|closes|closed|resolve|resolves|resolved)\s+#(\d+)",
                     r"#(\d+)"
@@ -501,6 +509,71 @@ class GitHubService:
         issue = await self.get_issue(repo, issue_number)
         return issue.state if issue else None
     
+    async def get_issue_states(self, repo: str, issue_numbers: List[int]) -> Dict[int, str]:
+        """
+        Get the state of many issues in a repository with GraphQL.
+        
+        Issues are fetched in batches of GRAPHQL_BATCH_SIZE aliased fields, so
+        checking N issues costs one request per batch instead of N requests.
+        The GraphQL API requires an access token.
+        
+        Args:
+            repo: Repository in format "owner/repo"
+            issue_numbers: Issue numbers to look up
+            
+        Returns:
+            Mapping of issue number to state ("open" or "closed"); issues that
+            no longer exist are omitted
+            
+        Raises:
+            GitHubAPIError: If no token is configured or the query fails
+        """
+        if not self.access_token:
+            raise GitHubAPIError("GitHub GraphQL API requires an access token")
+        
+        owner, name = repo.split("/", 1)
+        states: Dict[int, str] = {}
+        for start in range(0, len(issue_numbers), self.GRAPHQL_BATCH_SIZE):
+            batch = issue_numbers[start:start + self.GRAPHQL_BATCH_SIZE]
+            fields = " ".join(
+                f"i{number}: issue(number: {int(number)}) {{ number state }}"
+                for number in batch
+            )
+            query = f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+            data = await self._make_request(
+                "POST",
+                self.GRAPHQL_ENDPOINT,
+                json_data={"query": query, "variables": {"owner": owner, "name": name}}
+            )
+            
+            repository = (data.get("data") or {}).get("repository")
+            if repository is None:
+                raise GitHubAPIError(f"GitHub GraphQL query failed for {repo}: {data.get('errors')}")
+            for node in repository.values():
+                # Deleted or transferred issues come back as null
+                if node:
+                    states[node["number"]] = node["state"].lower()
+        return states
+    
+    async def get_pull_request(self, repo: str, pr_number: int) -> Optional[GitHubPullRequest]:
+        """
+        Get a specific pull request by number.
+        
+        Args:
+            repo: Repository in format "owner/repo"
+            pr_number: Pull request number
+        
+        Returns:
+            GitHubPullRequest object or None if not found
+        """
+        endpoint = f"/repos/{repo}/pulls/{pr_number}"
+        
+        try:
+            data = await self._make_request("GET", endpoint)
+            return GitHubPullRequest(**data)
+        except ResourceNotFound:
+            return None
+    
     def get_rate_limit_info(self) -> Optional[RateLimitInfo]:
         """
         Get current rate limit information.
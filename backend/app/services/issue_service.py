@@ -7,7 +7,7 @@ import json
 from typing import List, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, and_, func, String, text
+from sqlalchemy import or_, and_, func, String, text, select, update
 import json
 
 from app.models.issue import Issue, IssueStatus
@@ -24,10 +24,14 @@ from app.schemas.issue import (
 )
 from app.services.github_service import GitHubService, GitHubAPIError
 from app.services.cache_service import cache_service
+from app.db.functions import hours_until
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Released issue ids included in the auto-release log line
+AUTO_RELEASE_LOG_SAMPLE = 10
+
 
 class IssueService:
     """
@@ -44,6 +48,9 @@ class IssueService:
     CACHE_TTL = 300  # 5 minutes
     FILTERED_ISSUES_CACHE_PREFIX = "filtered_issues:"
     
+    # Expired claims are released and committed in batches of this size
+    AUTO_RELEASE_CHUNK_SIZE = 200
+    
     # Labels to fetch for beginner-friendly issues
     BEGINNER_LABELS = [
         "good first issue",
@@ -723,70 +730,83 @@ class IssueService:
                 message=f"Failed to extend deadline: {str(e)}"
             )
     
-    def auto_release_expired_claims(self) -> AutoReleaseResult:
+    def auto_release_expired_claims(self, chunk_size: int = AUTO_RELEASE_CHUNK_SIZE) -> AutoReleaseResult:
         """
         Automatically release expired claims.
         
         This method should be called by a background job (Celery task).
-        It finds all claimed issues with expired deadlines and releases them.
+        Each chunk of expired claims is released by a single
+        UPDATE ... RETURNING id statement and committed, so no issue rows
+        are loaded into Python and a backlog is worked off in bounded batches.
+        
+        Args:
+            chunk_size: Maximum number of issues released per statement
         
         Returns:
             AutoReleaseResult with count of released issues and any errors
         """
         released_ids = []
-        errors = []
         
         try:
-            # Find all claimed issues with expired deadlines
-            now = datetime.now(timezone.utc)
-            expired_issues = self.db.query(Issue).filter(
-                Issue.status == IssueStatus.CLAIMED,
-                Issue.claim_expires_at.isnot(None),
-                Issue.claim_expires_at < now
-            ).all()
-            
-            logger.info(f"Found {len(expired_issues)} expired claims to release")
-            
-            for issue in expired_issues:
-                try:
-                    # Release the issue
-                    issue.status = IssueStatus.AVAILABLE
-                    old_claimer = issue.claimed_by
-                    issue.claimed_by = None
-                    issue.claimed_at = None
-                    issue.claim_expires_at = None
-                    
-                    released_ids.append(issue.id)
-                    
-                    logger.info(f"Auto-released issue {issue.id} (was claimed by user {old_claimer})")
-                    
-                except Exception as e:
-                    error_msg = f"Failed to release issue {issue.id}: {str(e)}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
-            
-            # Commit all changes
-            self.db.commit()
+            while True:
+                # Expiry is compared against the database clock so workers
+                # with skewed clocks agree on which claims have lapsed.
+                expired = select(Issue.id, Issue.claimed_by).where(
+                    Issue.status == IssueStatus.CLAIMED,
+                    Issue.claim_expires_at.isnot(None),
+                    Issue.claim_expires_at < func.now()
+                ).order_by(Issue.id).limit(chunk_size).subquery()
+                # UPDATE ... FROM the expired subselect, so RETURNING can hand
+                # back each issue's claimer from before the release
+                stmt = update(Issue).where(
+                    Issue.id == expired.c.id,
+                    # Re-checked on the outer UPDATE so a claim changed
+                    # concurrently after the subselect is left alone
+                    Issue.status == IssueStatus.CLAIMED
+                ).values(
+                    status=IssueStatus.AVAILABLE,
+                    claimed_by=None,
+                    claimed_at=None,
+                    claim_expires_at=None
+                ).returning(Issue.id, expired.c.claimed_by)
+                chunk = self.db.execute(stmt).all()
+                chunk_ids = [issue_id for issue_id, _ in chunk]
+                for issue_id, old_claimer in chunk:
+                    logger.debug(f"Auto-released issue {issue_id} (was claimed by user {old_claimer})")
+                
+                # Commit each chunk so a late failure keeps earlier releases
+                self.db.commit()
+                released_ids.extend(chunk_ids)
+                
+                if len(chunk_ids) < chunk_size:
+                    break
             
             # Invalidate caches
             if released_ids:
                 self._invalidate_cache_pattern("")
             
-            logger.info(f"Auto-release completed: {len(released_ids)} issues released")
+            # The full id list is in the result; keep the log line bounded
+            sample = released_ids[:AUTO_RELEASE_LOG_SAMPLE]
+            logger.info(
+                f"Auto-release completed: {len(released_ids)} issues released"
+                + (f" (first {len(sample)}: {sample})" if sample else "")
+            )
             
             return AutoReleaseResult(
                 released_count=len(released_ids),
                 issue_ids=released_ids,
-                errors=errors
+                errors=[]
             )
             
         except Exception as e:
             self.db.rollback()
             error_msg = f"Auto-release failed: {str(e)}"
             logger.error(error_msg)
+            if released_ids:
+                self._invalidate_cache_pattern("")
             return AutoReleaseResult(
-                released_count=0,
-                issue_ids=[],
+                released_count=len(released_ids),
+                issue_ids=released_ids,
                 errors=[error_msg]
             )
     
@@ -818,3 +838,34 @@ class IssueService:
         except Exception as e:
             logger.error(f"Error fetching expiring claims: {str(e)}")
             return []
+    
+    def get_expiring_claims_with_hours_remaining(self, hours_threshold: int = 24) -> List[Tuple[Issue, float]]:
+        """
+        Get claims expiring within the threshold along with hours remaining.
+        
+        The hours remaining are computed by the database against its own
+        clock, so reminder emails don't redo the arithmetic per issue in
+        Python or mix naive and aware timestamps. Results are ordered by
+        soonest expiry first.
+        
+        Args:
+            hours_threshold: Number of hours before expiration to consider
+            
+        Returns:
+            List of (issue, hours_remaining) tuples
+        """
+        try:
+            hours_remaining = hours_until(Issue.claim_expires_at)
+            
+            rows = self.db.query(Issue).add_columns(hours_remaining).filter(
+                Issue.status == IssueStatus.CLAIMED,
+                Issue.claim_expires_at.isnot(None),
+                hours_remaining > 0,
+                hours_remaining <= hours_threshold
+            ).order_by(Issue.claim_expires_at).all()
+            
+            return [(issue, hours) for issue, hours in rows]
+            
+        except Exception as e:
+            logger.error(f"Error fetching expiring claims: {str(e)}")
+            return []
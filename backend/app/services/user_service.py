@@ -1,7 +1,7 @@
 from typing import Optional, Dict, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select, lambda_stmt
 from fastapi import HTTPException, status
 
 from app.models.user import User
@@ -9,7 +9,7 @@ from app.models.contribution import Contribution
 from app.schemas.user import UserUpdate, UserResponse
 from app.schemas.auth import GitHubUserData
 from app.core.config import settings
-from app.services.cache_service import cache_service, CacheKeys, CacheTTL
+from app.services.cache_service import cache_service, invalidation_bus, CacheKeys, CacheTTL
 
 
 class UserService:
@@ -18,6 +18,22 @@ class UserService:
     def __init__(self, db: Session):
         self.db = db
     
+    def _commit_keep_loaded(self) -> None:
+        """
+        Commit a user mutation without expiring the session's instances.
+        
+        Callers return the user they just wrote, and User's eager_defaults
+        already fetched the server-generated timestamps, so this skips the
+        refresh SELECT. The override is limited to this commit; the session
+        keeps its normal expire-on-commit behavior otherwise.
+        """
+        expire_on_commit = self.db.expire_on_commit
+        self.db.expire_on_commit = False
+        try:
+            self.db.commit()
+        finally:
+            self.db.expire_on_commit = expire_on_commit
+    
     def create_user(self, github_data: GitHubUserData) -> User:
         """
         Create a new user from GitHub profile data
@@ -53,24 +69,30 @@ class UserService:
         )
         
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        self._commit_keep_loaded()
         
         return user
     
+    # Lookups below are hot (auth, tasks) so they use lambda statements:
+    # SQLAlchemy caches the constructed statement keyed on the lambda's code
+    # and only re-binds the captured parameter on each call.
+    
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
-        return self.db.query(User).filter(User.id == user_id).first()
+        stmt = lambda_stmt(lambda: select(User).where(User.id == user_id).limit(1))
+        return self.db.execute(stmt).scalars().first()
     
     def get_user_by_github_id(self, github_id: int) -> Optional[User]:
         """Get user by GitHub ID"""
-        return self.db.query(User).filter(User.github_id == github_id).first()
+        stmt = lambda_stmt(lambda: select(User).where(User.github_id == github_id).limit(1))
+        return self.db.execute(stmt).scalars().first()
     
     def get_user_by_username(self, github_username: str) -> Optional[User]:
         """Get user by GitHub username"""
-        return self.db.query(User).filter(
-            User.github_username == github_username
-        ).first()
+        stmt = lambda_stmt(
+            lambda: select(User).where(User.github_username == github_username).limit(1)
+        )
+        return self.db.execute(stmt).scalars().first()
     
     def update_preferences(self, user_id: int, preferences: UserUpdate) -> User:
         """
@@ -95,12 +117,13 @@ class UserService:
         if preferences.preferred_labels is not None:
             user.preferred_labels = preferences.preferred_labels
         
-        self.db.commit()
-        self.db.refresh(user)
+        self._commit_keep_loaded()
         
         # Invalidate cached stats and profile when preferences change
-        cache_service.delete(CacheKeys.user_stats(user_id))
-        cache_service.delete(CacheKeys.user_profile(user_id))
+        invalidation_bus.invalidate(
+            CacheKeys.user_stats(user_id),
+            CacheKeys.user_profile(user_id)
+        )
         
         return user
     
@@ -126,8 +149,7 @@ class UserService:
         user.bio = github_data.bio
         user.location = github_data.location
         
-        self.db.commit()
-        self.db.refresh(user)
+        self._commit_keep_loaded()
         
         return user
     
@@ -200,12 +222,13 @@ class UserService:
             )
         
         user.total_contributions += 1
-        self.db.commit()
-        self.db.refresh(user)
+        self._commit_keep_loaded()
         
         # Invalidate cached stats
-        cache_service.delete(CacheKeys.user_stats(user_id))
-        cache_service.delete(CacheKeys.contribution_timeline(user_id))
+        invalidation_bus.invalidate(
+            CacheKeys.user_stats(user_id),
+            CacheKeys.contribution_timeline(user_id)
+        )
         
         return user
     
@@ -224,12 +247,13 @@ class UserService:
             )
         
         user.merged_prs += 1
-        self.db.commit()
-        self.db.refresh(user)
+        self._commit_keep_loaded()
         
         # Invalidate cached stats
-        cache_service.delete(CacheKeys.user_stats(user_id))
-        cache_service.delete(CacheKeys.contribution_timeline(user_id))
+        invalidation_bus.invalidate(
+            CacheKeys.user_stats(user_id),
+            CacheKeys.contribution_timeline(user_id)
+        )
         
         return user
     
@@ -275,28 +299,34 @@ class UserService:
         from app.models.issue import Issue
         from app.models.repository import Repository
         
-        contributions = self.db.query(Contribution).filter(
+        # Single joined query returning only the columns the timeline needs
+        rows = self.db.query(
+            Contribution.id,
+            Contribution.status,
+            Contribution.pr_url,
+            Contribution.submitted_at,
+            Contribution.merged_at,
+            Issue.title,
+            Repository.full_name
+        ).join(
+            Issue, Issue.id == Contribution.issue_id
+        ).outerjoin(
+            Repository, Repository.id == Issue.repository_id
+        ).filter(
             Contribution.user_id == user_id
         ).order_by(
             Contribution.submitted_at.desc()
         ).limit(limit).all()
         
-        result = []
-        for contrib in contributions:
-            issue = self.db.query(Issue).filter(Issue.id == contrib.issue_id).first()
-            if issue:
-                repo = self.db.query(Repository).filter(
-                    Repository.id == issue.repository_id
-                ).first()
-                
-                result.append({
-                    "contribution_id": contrib.id,
-                    "issue_title": issue.title,
-                    "repository": repo.full_name if repo else "Unknown",
-                    "status": contrib.status,
-                    "pr_url": contrib.pr_url,
-                    "submitted_at": contrib.submitted_at.isoformat(),
-                    "merged_at": contrib.merged_at.isoformat() if contrib.merged_at else None
-                })
-        
-        return result
+        return [
+            {
+                "contribution_id": row.id,
+                "issue_title": row.title,
+                "repository": row.full_name or "Unknown",
+                "status": row.status,
+                "pr_url": row.pr_url,
+                "submitted_at": row.submitted_at.isoformat(),
+                "merged_at": row.merged_at.isoformat() if row.merged_at else None
+            }
+            for row in rows
+        ]
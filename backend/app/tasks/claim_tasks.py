@@ -32,9 +32,11 @@ def send_expiration_reminders_task():
     db = SessionLocal()
     try:
         issue_service = IssueService(db=db)
-        expiring_issues = issue_service.get_expiring_claims(hours_threshold=settings.CLAIM_GRACE_PERIOD_HOURS)
-        logger.info(f"Found {len(expiring_issues)} claims expiring soon")
-        return {"expiring_count": len(expiring_issues), "issue_ids": [i.id for i in expiring_issues]}
+        expiring = issue_service.get_expiring_claims_with_hours_remaining(
+            hours_threshold=settings.CLAIM_GRACE_PERIOD_HOURS
+        )
+        logger.info(f"Found {len(expiring)} claims expiring soon")
+        return {"expiring_count": len(expiring), "issue_ids": [i.id for i, _ in expiring]}
     except Exception as e:
         logger.error(f"Expiration reminder task failed: {str(e)}")
         raise
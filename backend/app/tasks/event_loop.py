@@ -0,0 +1,46 @@
+"""
+Persistent event loops for running async code from synchronous tasks.
+
+Tasks run in worker threads (FastAPI BackgroundTasks, schedulers). Instead of
+asyncio.run() building and tearing down a loop on every call, each thread
+keeps one loop and reuses it for every coroutine it runs, along with a
+GitHubService whose HTTP connection pool is bound to that loop.
+"""
+import asyncio
+import threading
+from typing import Any, Coroutine
+
+from app.core.config import settings
+from app.services.github_service import GitHubService
+
+_local = threading.local()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return this thread's task event loop, creating it on first use."""
+    loop = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _local.loop = loop
+        # A client bound to a previous loop can't be reused on this one
+        _local.github_service = None
+    return loop
+
+
+def run_async(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion on this thread's persistent loop."""
+    return get_event_loop().run_until_complete(coro)
+
+
+def get_github_service() -> GitHubService:
+    """
+    Return this thread's shared GitHubService.
+
+    Its httpx client is tied to this thread's loop, so keep-alive connections
+    carry over between task runs. Callers must not close it.
+    """
+    service = getattr(_local, "github_service", None)
+    if service is None:
+        service = GitHubService(access_token=settings.GITHUB_TOKEN or None)
+        _local.github_service = service
+    return service
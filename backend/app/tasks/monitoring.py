@@ -3,44 +3,135 @@ Task monitoring utilities.
 Simplified version without Celery dependency.
 """
 import logging
+import time
+from dataclasses import dataclass, asdict
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from app.services.cache_service import get_redis_client
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 
+def _from_ns(timestamp_ns: int) -> Optional[datetime]:
+    """Convert a time.time_ns() value to a naive UTC datetime, only when reporting."""
+    return datetime.utcfromtimestamp(timestamp_ns / 1e9) if timestamp_ns else None
+
+
+@dataclass(slots=True)
+class TaskStats:
+    """Execution counters for one task name."""
+    total_runs: int = 0
+    successful_runs: int = 0
+    failed_runs: int = 0
+    total_duration: float = 0.0
+    last_run_ns: int = 0
+    last_error: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        stats = asdict(self)
+        stats["last_run"] = _from_ns(stats.pop("last_run_ns"))
+        return stats
+
+
 class TaskMonitor:
-    """Simple in-memory task execution monitor."""
+    """
+    Task execution monitor.
+
+    Stats are always kept in memory. A monitor created with ``shared=True``
+    also accumulates them in Redis, one hash per task under ``key_prefix``,
+    so every worker process of a deployment reports the same totals. Shared
+    hashes expire SHARED_STATS_TTL_SECONDS after their last update.
+    """
+
+    KEY_PREFIX = "task:stats:"
+    SHARED_STATS_TTL_SECONDS = 7 * 24 * 3600
 
-    def __init__(self):
-        self.task_stats = {}
+    def __init__(self, shared: bool = False, key_prefix: Optional[str] = None):
+        self.task_stats: Dict[str, TaskStats] = {}
+        self.shared = shared
+        # Deployments sharing one Redis keep separate totals per environment
+        self.key_prefix = key_prefix or f"{self.KEY_PREFIX}{settings.ENVIRONMENT}:"
 
     def record_task_execution(self, task_name: str, success: bool, duration_seconds: float, error: Optional[str] = None):
-        if task_name not in self.task_stats:
-            self.task_stats[task_name] = {
-                "total_runs": 0, "successful_runs": 0, "failed_runs": 0,
-                "total_duration": 0.0, "last_run": None, "last_error": None
-            }
-        stats = self.task_stats[task_name]
-        stats["total_runs"] += 1
-        stats["total_duration"] += duration_seconds
-        stats["last_run"] = datetime.utcnow()
+        stats = self.task_stats.get(task_name)
+        if stats is None:
+            stats = self.task_stats[task_name] = TaskStats()
+        stats.total_runs += 1
+        stats.total_duration += duration_seconds
+        stats.last_run_ns = time.time_ns()
         if success:
-            stats["successful_runs"] += 1
+            stats.successful_runs += 1
         else:
-            stats["failed_runs"] += 1
-            stats["last_error"] = error
+            stats.failed_runs += 1
+            stats.last_error = error
+
+        if self.shared:
+            self._record_shared(task_name, success, duration_seconds, stats.last_run_ns, error)
+
+    def _record_shared(self, task_name: str, success: bool, duration_seconds: float,
+                       last_run_ns: int, error: Optional[str]):
+        """Add one execution to the shared Redis hash in a single round trip."""
+        redis_client = get_redis_client()
+        if redis_client is None:
+            return
+        key = f"{self.key_prefix}{task_name}"
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.hincrby(key, "total_runs", 1)
+            pipe.hincrby(key, "successful_runs" if success else "failed_runs", 1)
+            pipe.hincrbyfloat(key, "total_duration", duration_seconds)
+            pipe.hset(key, "last_run_ns", last_run_ns)
+            if not success and error:
+                pipe.hset(key, "last_error", error)
+            pipe.expire(key, self.SHARED_STATS_TTL_SECONDS)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to record shared stats for {task_name}: {e}")
+
+    def _get_shared_stats(self) -> Optional[Dict[str, Any]]:
+        """Read every task's shared stats, or None when Redis is unavailable."""
+        redis_client = get_redis_client()
+        if redis_client is None:
+            return None
+        try:
+            keys = list(redis_client.scan_iter(match=f"{self.key_prefix}*", count=100))
+            pipe = redis_client.pipeline(transaction=False)
+            for key in keys:
+                pipe.hgetall(key)
+            hashes = pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to read shared task stats: {e}")
+            return None
+
+        all_stats = {}
+        for key, raw in zip(keys, hashes):
+            fields = {k.decode(): v.decode() for k, v in raw.items()}
+            all_stats[key.decode()[len(self.key_prefix):]] = {
+                "total_runs": int(fields.get("total_runs", 0)),
+                "successful_runs": int(fields.get("successful_runs", 0)),
+                "failed_runs": int(fields.get("failed_runs", 0)),
+                "total_duration": float(fields.get("total_duration", 0.0)),
+                "last_run": _from_ns(int(fields.get("last_run_ns", 0))),
+                "last_error": fields.get("last_error"),
+            }
+        return all_stats
 
     def get_task_stats(self, task_name: Optional[str] = None) -> Dict[str, Any]:
+        all_stats = self._get_shared_stats() if self.shared else None
+        if all_stats is None:
+            all_stats = {name: stats.as_dict() for name, stats in self.task_stats.items()}
         if task_name:
-            return self.task_stats.get(task_name, {})
-        return self.task_stats
+            return all_stats.get(task_name, {})
+        return all_stats
 
     def get_error_rate(self, task_name: str) -> float:
-        stats = self.task_stats.get(task_name)
+        stats = self.get_task_stats(task_name)
         if not stats or stats["total_runs"] == 0:
             return 0.0
         return (stats["failed_runs"] / stats["total_runs"]) * 100
 
 
-task_monitor = TaskMonitor()
+# Workers of a deployment report one set of totals whenever Redis is configured
+task_monitor = TaskMonitor(shared=bool(settings.REDIS_URL))
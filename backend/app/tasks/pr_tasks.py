@@ -4,14 +4,104 @@ Called directly as functions (no Celery).
 """
 import logging
 import asyncio
+import re
 from datetime import datetime
+from typing import Any, List, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 from app.db.base import SessionLocal
 from app.models.contribution import Contribution, ContributionStatus
 from app.models.issue import Issue, IssueStatus
-from app.services.github_service import GitHubService
+from app.schemas.github import GitHubPullRequest
+from app.tasks.event_loop import get_github_service, run_async
 
 logger = logging.getLogger(__name__)
 
+# Concurrent GitHub requests allowed during the open-PR sweep
+PR_CHECK_CONCURRENCY = 10
+# Upper bound for one PR check, so a hung request can't stall the sweep
+PR_CHECK_TIMEOUT_SECONDS = 30
+# Rows fetched per round trip when streaming sweep queries
+STREAM_BATCH_SIZE = 200
+
+# Expected format: https://github.com/owner/repo/pull/123
+_PR_URL_RE = re.compile(r"https?://github\.com/([^/]+)/([^/]+)/pull/(\d+)")
+
+
+def _pr_status_update(contribution: Any, pr: GitHubPullRequest) -> dict:
+    """
+    Work out a contribution's new status from its pull request.
+
+    ``contribution`` may be a Contribution or any row exposing its id,
+    issue_id, pr_url, status and merged_at.
+
+    Nothing is written to the session; callers apply the returned update
+    with _apply_pr_updates so a whole sweep lands in one flush.
+    """
+    update = {
+        "contribution_id": contribution.id,
+        "issue_id": contribution.issue_id,
+        "old_status": contribution.status,
+        "status": contribution.status,
+        "merged_at": contribution.merged_at,
+        "issue_status": None,
+    }
+    if pr.merged:
+        update["status"] = ContributionStatus.MERGED
+        update["merged_at"] = pr.merged_at or datetime.utcnow()
+        update["issue_status"] = IssueStatus.COMPLETED
+    elif pr.state == "closed":
+        update["status"] = ContributionStatus.CLOSED
+    elif pr.state == "open":
+        update["status"] = ContributionStatus.SUBMITTED
+    return update
+
+
+async def _check_pr(contribution: Any, pr_cache: Optional[dict] = None) -> dict:
+    """
+    Fetch a contribution's pull request from GitHub and compute its update.
+
+    ``pr_cache`` maps (repo, pr_number) to pull requests already fetched in
+    the same sweep, so contributions sharing a PR cost one request. Without
+    it the pull request is always fetched fresh.
+    """
+    match = _PR_URL_RE.match(contribution.pr_url)
+    if not match:
+        raise ValueError(f"Invalid PR URL format: {contribution.pr_url}")
+    owner, name, pr_number = match.groups()
+    key = (f"{owner}/{name}", int(pr_number))
+
+    if pr_cache is not None and key in pr_cache:
+        pr = pr_cache[key]
+    else:
+        pr = await get_github_service().get_pull_request(*key)
+        if pr_cache is not None:
+            pr_cache[key] = pr
+    if pr is None:
+        raise ValueError(f"Pull request not found: {contribution.pr_url}")
+    return _pr_status_update(contribution, pr)
+
+
+def _apply_pr_updates(db: Session, updates: List[dict]) -> int:
+    """Write changed PR statuses with one bulk UPDATE per table; returns the change count."""
+    contribution_rows = []
+    issue_rows = []
+    for update in updates:
+        if update["status"] != update["old_status"]:
+            contribution_rows.append({
+                "id": update["contribution_id"],
+                "status": update["status"],
+                "merged_at": update["merged_at"],
+            })
+        if update["issue_status"] is not None:
+            issue_rows.append({"id": update["issue_id"], "status": update["issue_status"]})
+
+    if contribution_rows:
+        db.bulk_update_mappings(Contribution, contribution_rows)
+    if issue_rows:
+        db.bulk_update_mappings(Issue, issue_rows)
+    return len(contribution_rows)
+
 
 def update_pr_status_task(contribution_id: int):
     """Update the status of a specific pull request."""
@@ -22,36 +112,100 @@ def update_pr_status_task(contribution_id: int):
         if not contribution:
             return {"success": False, "error": "Contribution not found"}
 
-        github_service = GitHubService()
-
-        async def check_pr():
-            try:
-                pr_info = await github_service.validate_pull_request(
-                    pr_url=contribution.pr_url, expected_user=None
-                )
-                old_status = contribution.status
-                if pr_info.merged:
-                    contribution.status = ContributionStatus.MERGED
-                    contribution.merged_at = pr_info.merged_at or datetime.utcnow()
-                    issue = db.query(Issue).filter(Issue.id == contribution.issue_id).first()
-                    if issue:
-                        issue.status = IssueStatus.COMPLETED
-                elif pr_info.state == "closed":
-                    contribution.status = ContributionStatus.CLOSED
-                elif pr_info.state == "open" and contribution.status != ContributionStatus.SUBMITTED:
-                    contribution.status = ContributionStatus.SUBMITTED
-                db.commit()
-                await github_service.close()
-                return {"success": True, "contribution_id": contribution_id,
-                        "old_status": old_status.value, "new_status": contribution.status.value}
-            except Exception as e:
-                await github_service.close()
-                raise e
-
-        return asyncio.run(check_pr())
+        update = run_async(_check_pr(contribution))
+        _apply_pr_updates(db, [update])
+        db.commit()
+        return {"success": True, "contribution_id": contribution_id,
+                "old_status": update["old_status"].value, "new_status": update["status"].value}
     except Exception as e:
         logger.error(f"Failed to update PR status: {str(e)}")
         db.rollback()
         return {"success": False, "error": str(e)}
     finally:
         db.close()
+
+
+def check_all_open_prs_task():
+    """
+    Sync every submitted contribution with GitHub in one pass.
+
+    Contributions are streamed in batches of STREAM_BATCH_SIZE rows. Each
+    batch is checked concurrently on a single event loop, bounded by
+    PR_CHECK_CONCURRENCY, and its status changes are written with one bulk
+    UPDATE per table; the whole sweep commits once. A failed or timed-out
+    check is reported in ``errors`` and never aborts the rest of the sweep.
+    """
+    logger.info("Checking all open pull requests")
+    db = SessionLocal()
+    try:
+        # Only the columns _check_pr reads; rows stream without ORM hydration
+        stmt = select(
+            Contribution.id, Contribution.issue_id, Contribution.pr_url,
+            Contribution.status, Contribution.merged_at
+        ).where(
+            Contribution.status == ContributionStatus.SUBMITTED
+        ).execution_options(stream_results=True, yield_per=STREAM_BATCH_SIZE)
+
+        # Pull requests fetched during this sweep only, shared across batches
+        pr_cache = {}
+
+        async def check_batch(batch):
+            semaphore = asyncio.Semaphore(PR_CHECK_CONCURRENCY)
+
+            async def bounded(contribution):
+                async with semaphore:
+                    return await asyncio.wait_for(
+                        _check_pr(contribution, pr_cache), PR_CHECK_TIMEOUT_SECONDS
+                    )
+
+            return await asyncio.gather(
+                *(bounded(c) for c in batch), return_exceptions=True
+            )
+
+        total_checked = 0
+        updated_count = 0
+        merged_count = 0
+        closed_count = 0
+        errors = []
+        for batch in db.execute(stmt).partitions():
+            total_checked += len(batch)
+            results = run_async(check_batch(batch))
+
+            updates = []
+            for contribution, result in zip(batch, results):
+                if isinstance(result, asyncio.TimeoutError):
+                    errors.append(f"Contribution {contribution.id}: timed out")
+                elif isinstance(result, Exception):
+                    errors.append(f"Contribution {contribution.id}: {str(result)}")
+                else:
+                    updates.append(result)
+
+            updated_count += _apply_pr_updates(db, updates)
+            for u in updates:
+                if u["status"] != u["old_status"]:
+                    if u["status"] == ContributionStatus.MERGED:
+                        merged_count += 1
+                    elif u["status"] == ContributionStatus.CLOSED:
+                        closed_count += 1
+
+        db.commit()
+
+        logger.info(
+            f"Checked {total_checked} open PRs, "
+            f"updated {updated_count} ({merged_count} merged, {closed_count} closed), "
+            f"{len(errors)} errors"
+        )
+        return {
+            "success": True,
+            "total_checked": total_checked,
+            "updated_count": updated_count,
+            "merged_count": merged_count,
+            "closed_count": closed_count,
+            "errors": errors,
+        }
+    except Exception as e:
+        logger.error(f"Failed to check open PRs: {str(e)}")
+        db.rollback()
+        return {"success": False, "error": str(e)}
+    finally:
+        db.close()
@@ -4,12 +4,32 @@ Called directly as functions (no Celery).
 """
 import logging
 import asyncio
+import re
+from collections import defaultdict
+from sqlalchemy import select, update
 from app.db.base import SessionLocal
+from app.models.issue import Issue, IssueStatus
+from app.services.cache_service import async_ttl_cache
 from app.services.issue_service import IssueService
 from app.tasks.difficulty_tasks import refine_difficulty_for_issues
+from app.tasks.event_loop import get_github_service, run_async
 
 logger = logging.getLogger(__name__)
 
+# Concurrent GitHub requests allowed while checking for closed issues
+ISSUE_CHECK_CONCURRENCY = 10
+# Rows fetched per round trip when streaming open issues
+STREAM_BATCH_SIZE = 500
+
+# Expected format: https://github.com/owner/repo/issues/123
+_ISSUE_URL_RE = re.compile(r"https?://github\.com/([^/]+)/([^/]+)/issues/(\d+)")
+
+
+@async_ttl_cache()
+async def _get_issue_state(repo: str, issue_number: int):
+    """Issue state lookup shared by overlapping checks within the cache TTL."""
+    return await get_github_service().check_issue_status(repo, issue_number)
+
 
 def sync_all_repositories_task():
     """Synchronize issues from all active repositories."""
@@ -17,7 +37,7 @@ def sync_all_repositories_task():
     db = SessionLocal()
     try:
         issue_service = IssueService(db=db)
-        result = asyncio.run(issue_service.sync_issues())
+        result = run_async(issue_service.sync_issues())
         logger.info(f"Sync completed: {result.repositories_synced} repos synced")
         # Refine difficulty for newly added issues via AI
         if result.new_issue_ids:
@@ -34,40 +54,77 @@ def sync_all_repositories_task():
 
 
 def check_closed_issues_task():
-    """Check if open issues in the database are still open on GitHub."""
+    """
+    Check if open issues in the database are still open on GitHub.
+
+    Issues are grouped by repository and looked up in one GraphQL query per
+    repository when a token is configured; otherwise, or if the query fails,
+    they are checked with concurrent REST requests.
+    """
     logger.info("Starting closed issues check")
     db = SessionLocal()
     try:
-        from app.models.issue import Issue, IssueStatus
-        from app.services.github_service import GitHubService
-
-        open_issues = db.query(Issue).filter(
+        # Stream (id, github_url) pairs only; closed issues are updated in SQL
+        stmt = select(Issue.id, Issue.github_url).where(
             Issue.status.in_([IssueStatus.AVAILABLE, IssueStatus.CLAIMED])
-        ).all()
-        logger.info(f"Checking {len(open_issues)} open issues")
+        )
+        issues_checked = 0
+        issues_by_repo = defaultdict(dict)
+        for issue in db.execute(stmt).yield_per(STREAM_BATCH_SIZE):
+            issues_checked += 1
+            match = _ISSUE_URL_RE.match(issue.github_url or "")
+            if not match:
+                logger.error(f"Failed to parse issue {issue.id} URL: {issue.github_url}")
+                continue
+            owner, name, issue_number = match.groups()
+            issues_by_repo[f"{owner}/{name}"][int(issue_number)] = issue.id
+        logger.info(f"Checking {issues_checked} open issues")
 
-        github_service = GitHubService()
-        closed_count = 0
+        github_service = get_github_service()
+        semaphore = asyncio.Semaphore(ISSUE_CHECK_CONCURRENCY)
 
-        async def check_issues():
-            nonlocal closed_count
-            for issue in open_issues:
+        async def check_one(repo, issue_number):
+            async with semaphore:
+                return await _get_issue_state(repo, issue_number)
+
+        async def check_repo(repo, issues):
+            numbers = list(issues)
+            if github_service.access_token:
                 try:
-                    parts = issue.github_url.split('/')
-                    repo = f"{parts[-4]}/{parts[-3]}"
-                    issue_number = int(parts[-1])
-                    status = await github_service.check_issue_status(repo, issue_number)
-                    if status == "closed":
-                        issue.status = IssueStatus.CLOSED
-                        closed_count += 1
+                    async with semaphore:
+                        return await github_service.get_issue_states(repo, numbers)
                 except Exception as e:
-                    logger.error(f"Failed to check issue {issue.id}: {str(e)}")
-            await github_service.close()
+                    logger.warning(f"GraphQL issue lookup failed for {repo}, falling back to REST: {str(e)}")
+            results = await asyncio.gather(
+                *(check_one(repo, number) for number in numbers), return_exceptions=True
+            )
+            states = {}
+            for number, result in zip(numbers, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to check issue {issues[number]}: {str(result)}")
+                elif result:
+                    states[number] = result
+            return states
+
+        async def check_issues():
+            return await asyncio.gather(
+                *(check_repo(repo, issues) for repo, issues in issues_by_repo.items())
+            )
+
+        repo_states = run_async(check_issues())
+        closed_ids = [
+            issues[number]
+            for issues, states in zip(issues_by_repo.values(), repo_states)
+            for number, state in states.items()
+            if state == "closed"
+        ]
 
-        asyncio.run(check_issues())
-        if closed_count > 0:
+        if closed_ids:
+            db.execute(
+                update(Issue).where(Issue.id.in_(closed_ids)).values(status=IssueStatus.CLOSED)
+            )
             db.commit()
-        return {"success": True, "issues_checked": len(open_issues), "issues_closed": closed_count}
+        return {"success": True, "issues_checked": issues_checked, "issues_closed": len(closed_ids)}
     except Exception as e:
         logger.error(f"Closed issues check failed: {str(e)}")
         db.rollback()
@@ -3,6 +3,7 @@ Tests for achievement service
 """
 import pytest
 from datetime import datetime
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.models.user import User
@@ -13,11 +14,14 @@ from app.models.achievement import Achievement, UserAchievement
 from app.services.achievement_service import AchievementService
 
 
+@pytest.mark.usefixtures("seeded_achievements")
 class TestAchievementService:
     """Test achievement service functionality"""
     
     def test_initialize_achievements(self, db_session: Session):
         """Test initializing predefined achievements"""
+        # Start from an empty table; the rollback restores the module seed
+        db_session.query(Achievement).delete()
         service = AchievementService(db_session)
         achievements = service.initialize_achievements()
         
@@ -39,7 +43,6 @@ class TestAchievementService:
     def test_get_user_achievements_no_contributions(self, db_session: Session, test_user: User):
         """Test getting achievements for user with no contributions"""
         service = AchievementService(db_session)
-        service.initialize_achievements()
         
         achievements = service.get_user_achievements(test_user.id)
         
@@ -54,14 +57,13 @@ class TestAchievementService:
     
     def test_milestone_achievement_first_pr(
         self,
-        db: Session,
+        db_session: Session,
         test_user: User,
         test_repository: Repository,
         test_issue: Issue
     ):
         """Test milestone achievement for first PR submission"""
         service = AchievementService(db_session)
-        service.initialize_achievements()
         
         # Create a contribution
         contribution = Contribution(
@@ -72,37 +74,33 @@ class TestAchievementService:
             status=ContributionStatus.SUBMITTED,
             points_earned=10
         )
-        db.add(contribution)
-        db.commit()
+        db_session.add(contribution)
+        db_session.flush()
         
         # Check and award achievements
         newly_awarded = service.check_and_award_achievements(test_user.id)
         
         # Should award "First Steps" achievement
         assert len(newly_awarded) > 0
-        first_steps = next((a for a in newly_awarded if a.name == "First Steps"), None)
-        assert first_steps is not None
+        awarded = {a.name: a for a in newly_awarded}
+        assert awarded.get("First Steps") is not None
         
         # Verify achievement is unlocked
-        achievements = service.get_user_achievements(test_user.id)
-        first_steps_progress = next(
-            (a for a in achievements if a.achievement.name == "First Steps"),
-            None
-        )
+        achievements = {a.achievement.name: a for a in service.get_user_achievements(test_user.id)}
+        first_steps_progress = achievements.get("First Steps")
         assert first_steps_progress is not None
         assert first_steps_progress.is_unlocked is True
         assert first_steps_progress.progress >= 1
     
     def test_milestone_achievement_first_merge(
         self,
-        db: Session,
+        db_session: Session,
         test_user: User,
         test_repository: Repository,
         test_issue: Issue
     ):
         """Test milestone achievement for first merged PR"""
         service = AchievementService(db_session)
-        service.initialize_achievements()
         
         # Create a merged contribution
         contribution = Contribution(
@@ -114,8 +112,8 @@ class TestAchievementService:
             merged_at=datetime.utcnow(),
             points_earned=100
         )
-        db.add(contribution)
-        db.commit()
+        db_session.add(contribution)
+        db_session.flush()
         
         # Check and award achievements
         newly_awarded = service.check_and_award_achievements(test_user.id)
@@ -123,233 +121,68 @@ class TestAchievementService:
         # Should award both "First Steps" and "Getting Started"
         assert len(newly_awarded) >= 2
         
-        achievement_names = [a.name for a in newly_awarded]
+        achievement_names = {a.name for a in newly_awarded}
         assert "First Steps" in achievement_names
         assert "Getting Started" in achievement_names
     
-    def test_milestone_achievement_multiple_prs(
-        self,
-        db: Session,
-        test_user: User,
-        test_repository: Repository
-    ):
-        """Test milestone achievements for multiple PRs"""
-        service = AchievementService(db_session)
-        service.initialize_achievements()
-        
-        # Create 5 issues and contributions
-        for i in range(5):
-            issue = Issue(
-                github_issue_id=1000 + i,
-                repository_id=test_repository.id,
-                title=f"Test Issue {i}",
-                description="Test description",
-                programming_language="Python",
-                difficulty_level="easy",
-                status=IssueStatus.COMPLETED,
-                github_url=f"https://github.com/test/repo/issues/{i}"
-            )
-            db.add(issue)
-            db.flush()
-            
-            contribution = Contribution(
-                user_id=test_user.id,
-                issue_id=issue.id,
-                pr_url=f"https://github.com/test/repo/pull/{i}",
-                pr_number=i,
-                status=ContributionStatus.MERGED,
-                merged_at=datetime.utcnow(),
-                points_earned=100
-            )
-            db.add(contribution)
-        
-        db.commit()
-        
-        # Check and award achievements
-        newly_awarded = service.check_and_award_achievements(test_user.id)
-        
-        # Should award "Contributor" and "Active Contributor"
-        achievement_names = [a.name for a in newly_awarded]
-        assert "Contributor" in achievement_names
-        assert "Active Contributor" in achievement_names
-        
-        # Verify progress
-        achievements = service.get_user_achievements(test_user.id)
-        contributor = next(
-            (a for a in achievements if a.achievement.name == "Contributor"),
-            None
-        )
-        assert contributor is not None
-        assert contributor.is_unlocked is True
-        assert contributor.progress == 5
-    
-    def test_language_achievement_python(
-        self,
-        db: Session,
-        test_user: User,
-        test_repository: Repository
-    ):
-        """Test language-specific achievement for Python"""
-        service = AchievementService(db_session)
-        service.initialize_achievements()
-        
-        # Create 5 Python contributions
-        for i in range(5):
-            issue = Issue(
-                github_issue_id=2000 + i,
-                repository_id=test_repository.id,
-                title=f"Python Issue {i}",
-                description="Test description",
-                programming_language="Python",
-                difficulty_level="easy",
-                status=IssueStatus.COMPLETED,
-                github_url=f"https://github.com/test/repo/issues/{i}"
-            )
-            db.add(issue)
-            db.flush()
-            
-            contribution = Contribution(
-                user_id=test_user.id,
-                issue_id=issue.id,
-                pr_url=f"https://github.com/test/repo/pull/{i}",
-                pr_number=i,
-                status=ContributionStatus.MERGED,
-                merged_at=datetime.utcnow(),
-                points_earned=100
-            )
-            db.add(contribution)
-        
-        db.commit()
-        
-        # Check and award achievements
-        newly_awarded = service.check_and_award_achievements(test_user.id)
-        
-        # Should award "Python Pioneer"
-        achievement_names = [a.name for a in newly_awarded]
-        assert "Python Pioneer" in achievement_names
-    
-    def test_polyglot_achievement(
+    @pytest.mark.parametrize("languages,expected_awarded,expected_progress", [
+        pytest.param(
+            ["Python"] * 5,
+            {"Contributor", "Active Contributor", "Python Pioneer"},
+            {"Contributor": (5, True)},
+            id="five_python_prs",
+        ),
+        pytest.param(
+            ["Python", "JavaScript", "TypeScript"],
+            {"Polyglot"},
+            {"Polyglot": (3, True)},
+            id="polyglot",
+        ),
+        pytest.param(
+            ["Python"] * 3,
+            set(),
+            {"Contributor": (3, False)},
+            id="progress_below_threshold",
+        ),
+    ])
+    def test_achievements_for_merged_contributions(
         self,
-        db: Session,
+        db_session: Session,
         test_user: User,
-        test_repository: Repository
+        test_repository: Repository,
+        languages,
+        expected_awarded,
+        expected_progress
     ):
-        """Test polyglot achievement for multiple languages"""
+        """Test awards and progress after several merged contributions"""
         service = AchievementService(db_session)
-        service.initialize_achievements()
-        
-        languages = ["Python", "JavaScript", "TypeScript"]
-        
-        # Create contributions in different languages
-        for i, language in enumerate(languages):
-            issue = Issue(
-                github_issue_id=3000 + i,
-                repository_id=test_repository.id,
-                title=f"{language} Issue",
-                description="Test description",
-                programming_language=language,
-                difficulty_level="easy",
-                status=IssueStatus.COMPLETED,
-                github_url=f"https://github.com/test/repo/issues/{i}"
-            )
-            db.add(issue)
-            db.flush()
-            
-            contribution = Contribution(
-                user_id=test_user.id,
-                issue_id=issue.id,
-                pr_url=f"https://github.com/test/repo/pull/{i}",
-                pr_number=i,
-                status=ContributionStatus.MERGED,
-                merged_at=datetime.utcnow(),
-                points_earned=100
-            )
-            db.add(contribution)
-        
-        db.commit()
+        add_merged_contributions(db_session, test_user, test_repository, languages)
         
         # Check and award achievements
         newly_awarded = service.check_and_award_achievements(test_user.id)
         
-        # Should award "Polyglot"
-        achievement_names = [a.name for a in newly_awarded]
-        assert "Polyglot" in achievement_names
+        achievement_names = {a.name for a in newly_awarded}
+        assert expected_awarded <= achievement_names
         
         # Verify progress
-        achievements = service.get_user_achievements(test_user.id)
-        polyglot = next(
-            (a for a in achievements if a.achievement.name == "Polyglot"),
-            None
-        )
-        assert polyglot is not None
-        assert polyglot.is_unlocked is True
-        assert polyglot.progress == 3
-    
-    def test_achievement_progress_tracking(
-        self,
-        db: Session,
-        test_user: User,
-        test_repository: Repository,
-        test_issue: Issue
-    ):
-        """Test achievement progress tracking"""
-        service = AchievementService(db_session)
-        service.initialize_achievements()
-        
-        # Create 3 contributions (not enough for 5-threshold achievements)
-        for i in range(3):
-            issue = Issue(
-                github_issue_id=4000 + i,
-                repository_id=test_repository.id,
-                title=f"Test Issue {i}",
-                description="Test description",
-                programming_language="Python",
-                difficulty_level="easy",
-                status=IssueStatus.COMPLETED,
-                github_url=f"https://github.com/test/repo/issues/{i}"
+        achievements = {a.achievement.name: a for a in service.get_user_achievements(test_user.id)}
+        for name, (progress, is_unlocked) in expected_progress.items():
+            achievement = achievements[name]
+            assert achievement.is_unlocked is is_unlocked
+            assert achievement.progress == progress
+            assert achievement.percentage == min(
+                progress / achievement.achievement.threshold * 100, 100.0
             )
-            db.add(issue)
-            db.flush()
-            
-            contribution = Contribution(
-                user_id=test_user.id,
-                issue_id=issue.id,
-                pr_url=f"https://github.com/test/repo/pull/{i}",
-                pr_number=i,
-                status=ContributionStatus.MERGED,
-                merged_at=datetime.utcnow(),
-                points_earned=100
-            )
-            db.add(contribution)
-        
-        db.commit()
-        
-        # Check achievements
-        service.check_and_award_achievements(test_user.id)
-        
-        # Get achievement progress
-        achievements = service.get_user_achievements(test_user.id)
-        
-        # "Contributor" (5 PRs) should be in progress
-        contributor = next(
-            (a for a in achievements if a.achievement.name == "Contributor"),
-            None
-        )
-        assert contributor is not None
-        assert contributor.is_unlocked is False
-        assert contributor.progress == 3
-        assert contributor.percentage == 60.0  # 3/5 * 100
     
     def test_get_achievement_stats(
         self,
-        db: Session,
+        db_session: Session,
         test_user: User,
         test_repository: Repository,
         test_issue: Issue
     ):
         """Test getting achievement statistics"""
         service = AchievementService(db_session)
-        service.initialize_achievements()
         
         # Create one contribution to unlock some achievements
         contribution = Contribution(
@@ -361,8 +194,8 @@ class TestAchievementService:
             merged_at=datetime.utcnow(),
             points_earned=100
         )
-        db.add(contribution)
-        db.commit()
+        db_session.add(contribution)
+        db_session.flush()
         
         # Award achievements
         service.check_and_award_achievements(test_user.id)
@@ -377,14 +210,13 @@ class TestAchievementService:
     
     def test_get_unlocked_achievements(
         self,
-        db: Session,
+        db_session: Session,
         test_user: User,
         test_repository: Repository,
         test_issue: Issue
     ):
         """Test getting only unlocked achievements"""
         service = AchievementService(db_session)
-        service.initialize_achievements()
         
         # Create a merged contribution
         contribution = Contribution(
@@ -396,8 +228,8 @@ class TestAchievementService:
             merged_at=datetime.utcnow(),
             points_earned=100
         )
-        db.add(contribution)
-        db.commit()
+        db_session.add(contribution)
+        db_session.flush()
         
         # Award achievements
         service.check_and_award_achievements(test_user.id)
@@ -411,6 +243,45 @@ class TestAchievementService:
             assert achievement.earned_at is not None
 
 
+def add_merged_contributions(
+    db_session: Session,
+    user: User,
+    repository: Repository,
+    languages: list
+) -> None:
+    """Insert one completed issue with a merged contribution per language"""
+    merged_at = datetime.utcnow()
+    issue_ids = db_session.scalars(
+        insert(Issue).returning(Issue.id, sort_by_parameter_order=True),
+        [
+            {
+                "github_issue_id": 1000 + i,
+                "repository_id": repository.id,
+                "title": f"{language} Issue {i}",
+                "description": "Test description",
+                "programming_language": language,
+                "difficulty_level": "easy",
+                "status": IssueStatus.COMPLETED,
+                "github_url": f"https://github.com/test/repo/issues/{i}",
+            }
+            for i, language in enumerate(languages)
+        ]
+    ).all()
+    db_session.execute(insert(Contribution), [
+        {
+            "user_id": user.id,
+            "issue_id": issue_id,
+            "pr_url": f"https://github.com/test/repo/pull/{i}",
+            "pr_number": i,
+            "status": ContributionStatus.MERGED,
+            "merged_at": merged_at,
+            "points_earned": 100,
+        }
+        for i, issue_id in enumerate(issue_ids)
+    ])
+    db_session.flush()
+
+
 @pytest.fixture
 def test_user(db_session: Session) -> User:
     """Create a test user"""
@@ -423,9 +294,8 @@ def test_user(db_session: Session) -> User:
         total_contributions=0,
         merged_prs=0
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    db_session.add(user)
+    db_session.flush()
     return user
 
 
@@ -442,9 +312,8 @@ def test_repository(db_session: Session) -> Repository:
         forks=10,
         is_active=True
     )
-    db.add(repo)
-    db.commit()
-    db.refresh(repo)
+    db_session.add(repo)
+    db_session.flush()
     return repo
 
 
@@ -461,7 +330,6 @@ def test_issue(db_session: Session, test_repository: Repository) -> Issue:
         status=IssueStatus.AVAILABLE,
         github_url="https://github.com/test/repo/issues/999"
     )
-    db.add(issue)
-    db.commit()
-    db.refresh(issue)
+    db_session.add(issue)
+    db_session.flush()
     return issue
@@ -3,16 +3,50 @@ Tests for admin service
 """
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, AsyncMock
+from types import SimpleNamespace
+from unittest.mock import Mock, patch, AsyncMock, DEFAULT
 from sqlalchemy.orm import Session
 
-from app.services.admin_service import AdminService
-from app.models.user import User
-from app.models.repository import Repository
+from app.services.admin_service import AdminService, reset_health_probe_cache
 from app.models.issue import Issue, IssueStatus
 from app.models.contribution import Contribution, ContributionStatus
 
 
+# Fixed timestamp for mocked rows; nothing here depends on the real clock
+NOW = datetime(2024, 1, 1)
+
+
+POPULATED_STATS = {
+    "total_users": 100,
+    "active_users_last_30_days": 50,
+    "total_repositories": 20,
+    "active_repositories": 15,
+    "total_issues": 500,
+    "available_issues": 200,
+    "claimed_issues": 150,
+    "completed_issues": 100,
+    "total_contributions": 300,
+    "merged_prs": 250,
+    "pending_prs": 50,
+}
+
+
+def paginated_query(items):
+    """Query mock answering count() and order_by().offset().limit().all()"""
+    query = Mock()
+    query.count.return_value = len(items)
+    query.order_by.return_value.offset.return_value.limit.return_value.all.return_value = items
+    return query
+
+
+@pytest.fixture(autouse=True)
+def _reset_health_probes():
+    """Don't let a memoized probe from one test answer for the next"""
+    reset_health_probe_cache()
+    yield
+    reset_health_probe_cache()
+
+
 @pytest.fixture
 def mock_db():
     """Mock database session"""
@@ -31,81 +65,117 @@ def mock_redis():
     return redis_mock
 
 
+@pytest.fixture(scope="module")
+def repo_mock_factory():
+    """Build plain Repository stand-ins; tests only read the attributes they set"""
+    def make(**attrs):
+        repo = Mock()
+        repo.configure_mock(**attrs)
+        return repo
+    return make
+
+
+@pytest.fixture(scope="module")
+def user_mock_factory():
+    """Build plain User stand-ins; tests only read the attributes they set"""
+    def make(**attrs):
+        user = Mock()
+        user.configure_mock(**attrs)
+        return user
+    return make
+
+
+@pytest.fixture(scope="module")
+def admin_service_patches():
+    """GitHubService, settings and the Redis client patched together, once for the module"""
+    with patch.multiple(
+        'app.services.admin_service',
+        GitHubService=DEFAULT,
+        settings=DEFAULT,
+        get_redis_client=DEFAULT,
+        invalidation_bus=DEFAULT
+    ) as mocks:
+        mock_github = AsyncMock()
+        mock_github.close = AsyncMock()
+        mocks['GitHubService'].return_value = mock_github
+        yield SimpleNamespace(
+            github=mock_github,
+            settings=mocks['settings'],
+            get_redis_client=mocks['get_redis_client'],
+            invalidation_bus=mocks['invalidation_bus']
+        )
+
+
+@pytest.fixture
+def patched_github(admin_service_patches):
+    """The shared GitHubService mock, reset so tests set the calls they need"""
+    mock_github = admin_service_patches.github
+    mock_github.reset_mock(return_value=True, side_effect=True)
+    return mock_github
+
+
+@pytest.fixture
+def patched_settings(admin_service_patches):
+    """The shared settings mock; tests assign every setting they read"""
+    return admin_service_patches.settings
+
+
+@pytest.fixture
+def patched_redis(admin_service_patches, mock_redis):
+    """Serve mock_redis as the shared client behind a connected invalidation bus"""
+    admin_service_patches.invalidation_bus.connected = True
+    admin_service_patches.get_redis_client.return_value = mock_redis
+    return mock_redis
+
+
 @pytest.fixture
 def admin_service(mock_db, mock_redis):
     """Create admin service instance"""
-    return AdminService(mock_db, mock_redis)
+    return AdminService(mock_db)
 
 
 class TestPlatformStats:
     """Tests for platform statistics"""
     
-    def test_get_platform_stats_success(self, admin_service, mock_db):
+    @pytest.mark.parametrize("scalars,expected", [
+        pytest.param(list(POPULATED_STATS.values()), POPULATED_STATS, id="populated"),
+        pytest.param([None] * len(POPULATED_STATS), dict.fromkeys(POPULATED_STATS, 0), id="empty_tables"),
+    ])
+    def test_get_platform_stats_success(self, admin_service, mock_db, scalars, expected):
         """Test getting platform statistics"""
         # Create a mock query chain that returns proper values
         mock_query = Mock()
         
-        # Set up the query chain to return different values for each call
-        call_count = [0]
-        def mock_scalar():
-            values = [
-                100,  # total_users
-                50,   # active_users
-                20,   # total_repositories
-                15,   # active_repositories
-                500,  # total_issues
-                200,  # available_issues
-                150,  # claimed_issues
-                100,  # completed_issues
-                300,  # total_contributions
-                250,  # merged_prs
-                50    # pending_prs
-            ]
-            result = values[call_count[0]]
-            call_count[0] += 1
-            return result
-        
-        mock_query.scalar = mock_scalar
+        # The service reads the counts in PlatformStats field order
+        mock_query.scalar = Mock(side_effect=scalars)
         mock_query.filter.return_value = mock_query
         mock_db.query.return_value = mock_query
         
         stats = admin_service.get_platform_stats()
         
-        assert stats.total_users == 100
-        assert stats.active_users_last_30_days == 50
-        assert stats.total_repositories == 20
-        assert stats.active_repositories == 15
-        assert stats.total_issues == 500
-        assert stats.available_issues == 200
-        assert stats.claimed_issues == 150
-        assert stats.completed_issues == 100
-        assert stats.total_contributions == 300
-        assert stats.merged_prs == 250
-        assert stats.pending_prs == 50
+        assert stats.model_dump() == expected
 
 
 class TestRepositoryManagement:
     """Tests for repository management"""
     
-    def test_get_repositories(self, admin_service, mock_db):
+    def test_get_repositories(self, admin_service, mock_db, repo_mock_factory):
         """Test getting repositories with pagination"""
         # Mock repository data
-        mock_repo = Mock(spec=Repository)
-        mock_repo.id = 1
-        mock_repo.full_name = "test/repo"
-        mock_repo.name = "repo"
-        mock_repo.description = "Test repository"
-        mock_repo.primary_language = "Python"
-        mock_repo.stars = 100
-        mock_repo.forks = 50
-        mock_repo.is_active = True
-        mock_repo.last_synced = datetime.utcnow()
-        mock_repo.created_at = datetime.utcnow()
+        mock_repo = repo_mock_factory(
+            id=1,
+            full_name="test/repo",
+            name="repo",
+            description="Test repository",
+            primary_language="Python",
+            stars=100,
+            forks=50,
+            is_active=True,
+            last_synced=NOW,
+            created_at=NOW
+        )
         
-        mock_query = Mock()
-        mock_query.count.return_value = 1
-        mock_query.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [mock_repo]
-        mock_db.query.return_value = mock_query
+        mock_db.query.return_value = paginated_query([mock_repo])
         
         # Mock issue count
         mock_db.query.return_value.filter.return_value.scalar.return_value = 10
@@ -118,7 +188,7 @@ class TestRepositoryManagement:
         assert repositories[0].issue_count == 10
     
     @pytest.mark.asyncio
-    async def test_add_repository_success(self, admin_service, mock_db):
+    async def test_add_repository_success(self, admin_service, mock_db, patched_github):
         """Test adding a new repository"""
         # Mock GitHub service
         mock_repo_info = Mock()
@@ -131,19 +201,15 @@ class TestRepositoryManagement:
         mock_repo_info.stargazers_count = 50000
         mock_repo_info.forks_count = 10000
         
-        with patch('app.services.admin_service.GitHubService') as MockGitHubService:
-            mock_github = AsyncMock()
-            mock_github.get_repository_info.return_value = mock_repo_info
-            mock_github.close = AsyncMock()
-            MockGitHubService.return_value = mock_github
-            
-            # Mock database query
-            mock_db.query.return_value.filter.return_value.first.return_value = None
-            
-            repo = await admin_service.add_repository("facebook/react")
-            
-            mock_db.add.assert_called_once()
-            mock_db.commit.assert_called_once()
+        patched_github.get_repository_info.return_value = mock_repo_info
+        
+        # Mock database query
+        mock_db.query.return_value.filter.return_value.first.return_value = None
+        
+        repo = await admin_service.add_repository("facebook/react")
+        
+        mock_db.add.assert_called_once()
+        mock_db.commit.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_add_repository_already_exists(self, admin_service, mock_db):
@@ -154,12 +220,9 @@ class TestRepositoryManagement:
         with pytest.raises(ValueError, match="already exists"):
             await admin_service.add_repository("facebook/react")
     
-    def test_update_repository(self, admin_service, mock_db):
+    def test_update_repository(self, admin_service, mock_db, repo_mock_factory):
         """Test updating repository settings"""
-        mock_repo = Mock(spec=Repository)
-        mock_repo.id = 1
-        mock_repo.full_name = "test/repo"
-        mock_repo.is_active = True
+        mock_repo = repo_mock_factory(id=1, full_name="test/repo", is_active=True)
         
         mock_db.query.return_value.filter.return_value.first.return_value = mock_repo
         
@@ -168,11 +231,9 @@ class TestRepositoryManagement:
         assert updated_repo.is_active == False
         mock_db.commit.assert_called_once()
     
-    def test_delete_repository(self, admin_service, mock_db):
+    def test_delete_repository(self, admin_service, mock_db, repo_mock_factory):
         """Test deleting a repository"""
-        mock_repo = Mock(spec=Repository)
-        mock_repo.id = 1
-        mock_repo.full_name = "test/repo"
+        mock_repo = repo_mock_factory(id=1, full_name="test/repo")
         
         mock_db.query.return_value.filter.return_value.first.return_value = mock_repo
         
@@ -186,22 +247,20 @@ class TestRepositoryManagement:
 class TestUserManagement:
     """Tests for user management"""
     
-    def test_get_users(self, admin_service, mock_db):
+    def test_get_users(self, admin_service, mock_db, user_mock_factory):
         """Test getting users with pagination"""
-        mock_user = Mock(spec=User)
-        mock_user.id = 1
-        mock_user.github_username = "testuser"
-        mock_user.email = "test@example.com"
-        mock_user.full_name = "Test User"
-        mock_user.is_admin = False
-        mock_user.total_contributions = 10
-        mock_user.merged_prs = 5
-        mock_user.created_at = datetime.utcnow()
+        mock_user = user_mock_factory(
+            id=1,
+            github_username="testuser",
+            email="test@example.com",
+            full_name="Test User",
+            is_admin=False,
+            total_contributions=10,
+            merged_prs=5,
+            created_at=NOW
+        )
         
-        mock_query = Mock()
-        mock_query.count.return_value = 1
-        mock_query.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [mock_user]
-        mock_db.query.return_value = mock_query
+        mock_db.query.return_value = paginated_query([mock_user])
         
         # Mock claimed issues count
         mock_db.query.return_value.filter.return_value.scalar.return_value = 2
@@ -213,12 +272,9 @@ class TestUserManagement:
         assert users[0].github_username == "testuser"
         assert users[0].claimed_issues_count == 2
     
-    def test_update_user_role(self, admin_service, mock_db):
+    def test_update_user_role(self, admin_service, mock_db, user_mock_factory):
         """Test updating user admin role"""
-        mock_user = Mock(spec=User)
-        mock_user.id = 1
-        mock_user.github_username = "testuser"
-        mock_user.is_admin = False
+        mock_user = user_mock_factory(id=1, github_username="testuser", is_admin=False)
         
         mock_db.query.return_value.filter.return_value.first.return_value = mock_user
         
@@ -232,7 +288,9 @@ class TestSystemHealth:
     """Tests for system health checks"""
     
     @pytest.mark.asyncio
-    async def test_check_system_health_all_healthy(self, admin_service, mock_db, mock_redis):
+    async def test_check_system_health_all_healthy(
+        self, admin_service, mock_db, patched_redis, patched_github, patched_settings
+    ):
         """Test system health check when all components are healthy"""
         # Mock database check
         mock_db.execute.return_value = None
@@ -241,26 +299,22 @@ class TestSystemHealth:
         mock_rate_limit = Mock()
         mock_rate_limit.remaining = 5000
         mock_rate_limit.limit = 5000
-        mock_rate_limit.reset_at = datetime.utcnow()
-        
-        with patch('app.services.admin_service.GitHubService') as MockGitHubService:
-            mock_github = AsyncMock()
-            mock_github.get_rate_limit.return_value = mock_rate_limit
-            mock_github.close = AsyncMock()
-            MockGitHubService.return_value = mock_github
-            
-            with patch('app.services.admin_service.settings') as mock_settings:
-                mock_settings.OPENAI_API_KEY = "test-key"
-                
-                health = await admin_service.check_system_health()
-                
-                assert health.status == "healthy"
-                assert health.database["status"] == "healthy"
-                assert health.redis["status"] == "healthy"
-                assert health.github_api["status"] == "healthy"
+        mock_rate_limit.reset_at = NOW
+        patched_github.get_rate_limit.return_value = mock_rate_limit
+        
+        patched_settings.OPENAI_API_KEY = "test-key"
+        
+        health = await admin_service.check_system_health()
+        
+        assert health.status == "healthy"
+        assert health.database["status"] == "healthy"
+        assert health.redis["status"] == "healthy"
+        assert health.github_api["status"] == "healthy"
     
     @pytest.mark.asyncio
-    async def test_check_system_health_database_unhealthy(self, admin_service, mock_db, mock_redis):
+    async def test_check_system_health_database_unhealthy(
+        self, admin_service, mock_db, patched_redis, patched_github, patched_settings
+    ):
         """Test system health check when database is unhealthy"""
         # Mock database failure
         mock_db.execute.side_effect = Exception("Database connection failed")
@@ -269,88 +323,126 @@ class TestSystemHealth:
         mock_rate_limit = Mock()
         mock_rate_limit.remaining = 5000
         mock_rate_limit.limit = 5000
-        mock_rate_limit.reset_at = datetime.utcnow()
-        
-        with patch('app.services.admin_service.GitHubService') as MockGitHubService:
-            mock_github = AsyncMock()
-            mock_github.get_rate_limit.return_value = mock_rate_limit
-            mock_github.close = AsyncMock()
-            MockGitHubService.return_value = mock_github
-            
-            with patch('app.services.admin_service.settings') as mock_settings:
-                mock_settings.OPENAI_API_KEY = "test-key"
-                
-                health = await admin_service.check_system_health()
-                
-                assert health.status == "unhealthy"
-                assert health.database["status"] == "unhealthy"
+        mock_rate_limit.reset_at = NOW
+        patched_github.get_rate_limit.return_value = mock_rate_limit
+        
+        patched_settings.OPENAI_API_KEY = "test-key"
+        
+        health = await admin_service.check_system_health()
+        
+        assert health.status == "unhealthy"
+        assert health.database["status"] == "unhealthy"
+    
+    @pytest.mark.asyncio
+    async def test_check_system_health_redis_not_configured(
+        self, admin_service, mock_db, patched_redis, patched_github, patched_settings,
+        admin_service_patches
+    ):
+        """Test Redis is reported not_configured, and not pinged, without the invalidation bus"""
+        admin_service_patches.invalidation_bus.connected = False
+        
+        mock_rate_limit = Mock()
+        mock_rate_limit.remaining = 5000
+        mock_rate_limit.limit = 5000
+        mock_rate_limit.reset_at = NOW
+        patched_github.get_rate_limit.return_value = mock_rate_limit
+        
+        health = await admin_service.check_system_health()
+        
+        assert health.redis["status"] == "not_configured"
+        patched_redis.ping.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_check_system_health_redis_ping_memo_resets(
+        self, admin_service, mock_db, patched_redis, patched_github, patched_settings
+    ):
+        """Test a recent PING is reused until the health probe cache is reset"""
+        patched_github.get_rate_limit.return_value = Mock(limit=5000, remaining=5000, reset_at=NOW)
+        
+        await admin_service.check_system_health()
+        health = await admin_service.check_system_health()
+        assert health.redis["details"]["cached"] is True
+        assert patched_redis.ping.call_count == 1
+        
+        reset_health_probe_cache()
+        health = await admin_service.check_system_health()
+        assert health.redis["details"]["cached"] is False
+        assert patched_redis.ping.call_count == 2
 
 
 class TestConfiguration:
     """Tests for configuration management"""
     
-    def test_get_configuration(self, admin_service):
+    def test_get_configuration(self, admin_service, patched_settings):
         """Test getting current configuration"""
-        with patch('app.services.admin_service.settings') as mock_settings:
-            mock_settings.GITHUB_CLIENT_ID = "test-client-id"
-            mock_settings.OPENAI_API_KEY = "test-key"
-            mock_settings.EMAIL_ENABLED = True
-            mock_settings.CLAIM_TIMEOUT_EASY_DAYS = 7
-            mock_settings.CLAIM_TIMEOUT_MEDIUM_DAYS = 14
-            mock_settings.CLAIM_TIMEOUT_HARD_DAYS = 21
-            mock_settings.CLAIM_GRACE_PERIOD_HOURS = 24
-            mock_settings.ENVIRONMENT = "development"
-            
-            config = admin_service.get_configuration()
-            
-            assert config.github_client_id == "test-client-id"
-            assert config.openai_configured == True
-            assert config.email_enabled == True
-            assert config.claim_timeout_easy_days == 7
+        patched_settings.GITHUB_CLIENT_ID = "test-client-id"
+        patched_settings.OPENAI_API_KEY = "test-key"
+        patched_settings.EMAIL_ENABLED = True
+        patched_settings.CLAIM_TIMEOUT_EASY_DAYS = 7
+        patched_settings.CLAIM_TIMEOUT_MEDIUM_DAYS = 14
+        patched_settings.CLAIM_TIMEOUT_HARD_DAYS = 21
+        patched_settings.CLAIM_GRACE_PERIOD_HOURS = 24
+        patched_settings.ENVIRONMENT = "development"
+        
+        config = admin_service.get_configuration()
+        
+        assert config.github_client_id == "test-client-id"
+        assert config.openai_configured == True
+        assert config.email_enabled == True
+        assert config.claim_timeout_easy_days == 7
     
-    def test_update_configuration(self, admin_service):
+    def test_update_configuration(self, admin_service, patched_settings):
         """Test updating configuration"""
-        with patch('app.services.admin_service.settings') as mock_settings:
-            mock_settings.GITHUB_CLIENT_ID = "test-client-id"
-            mock_settings.OPENAI_API_KEY = "test-key"
-            mock_settings.EMAIL_ENABLED = False
-            mock_settings.CLAIM_TIMEOUT_EASY_DAYS = 7
-            mock_settings.CLAIM_TIMEOUT_MEDIUM_DAYS = 14
-            mock_settings.CLAIM_TIMEOUT_HARD_DAYS = 21
-            mock_settings.CLAIM_GRACE_PERIOD_HOURS = 24
-            mock_settings.ENVIRONMENT = "development"
-            
-            updates = {
-                "claim_timeout_easy_days": 10,
-                "email_enabled": True
-            }
-            
-            config = admin_service.update_configuration(updates)
-            
-            assert mock_settings.CLAIM_TIMEOUT_EASY_DAYS == 10
-            assert mock_settings.EMAIL_ENABLED == True
+        patched_settings.GITHUB_CLIENT_ID = "test-client-id"
+        patched_settings.OPENAI_API_KEY = "test-key"
+        patched_settings.EMAIL_ENABLED = False
+        patched_settings.CLAIM_TIMEOUT_EASY_DAYS = 7
+        patched_settings.CLAIM_TIMEOUT_MEDIUM_DAYS = 14
+        patched_settings.CLAIM_TIMEOUT_HARD_DAYS = 21
+        patched_settings.CLAIM_GRACE_PERIOD_HOURS = 24
+        patched_settings.ENVIRONMENT = "development"
+        
+        updates = {
+            "claim_timeout_easy_days": 10,
+            "email_enabled": True
+        }
+        
+        config = admin_service.update_configuration(updates)
+        
+        assert patched_settings.CLAIM_TIMEOUT_EASY_DAYS == 10
+        assert patched_settings.EMAIL_ENABLED == True
 
 
 class TestRateLimit:
     """Tests for rate limit status"""
     
     @pytest.mark.asyncio
-    async def test_get_rate_limit_status(self, admin_service):
+    async def test_get_rate_limit_status(self, admin_service, patched_github):
         """Test getting GitHub API rate limit status"""
         mock_rate_limit = Mock()
         mock_rate_limit.limit = 5000
         mock_rate_limit.remaining = 4000
-        mock_rate_limit.reset_at = datetime.utcnow()
-        
-        with patch('app.services.admin_service.GitHubService') as MockGitHubService:
-            mock_github = AsyncMock()
-            mock_github.get_rate_limit.return_value = mock_rate_limit
-            mock_github.close = AsyncMock()
-            MockGitHubService.return_value = mock_github
-            
-            rate_limit = await admin_service.get_rate_limit_status()
-            
-            assert rate_limit.limit == 5000
-            assert rate_limit.remaining == 4000
-            assert rate_limit.used == 1000
-            assert rate_limit.percentage_used == 20.0
+        mock_rate_limit.reset_at = NOW
+        patched_github.get_rate_limit.return_value = mock_rate_limit
+        
+        rate_limit = await admin_service.get_rate_limit_status()
+        
+        assert rate_limit.limit == 5000
+        assert rate_limit.remaining == 4000
+        assert rate_limit.used == 1000
+        assert rate_limit.percentage_used == 20.0
+    
+    @pytest.mark.asyncio
+    async def test_get_rate_limit_status_bypasses_health_memo(
+        self, admin_service, mock_db, patched_redis, patched_github, patched_settings
+    ):
+        """Test the rate-limit status is fetched live even right after a health check"""
+        stale = Mock(limit=5000, remaining=4000, reset_at=NOW)
+        live = Mock(limit=5000, remaining=3000, reset_at=NOW)
+        patched_github.get_rate_limit.side_effect = [stale, live]
+        
+        await admin_service.check_system_health()
+        rate_limit = await admin_service.get_rate_limit_status()
+        
+        assert rate_limit.remaining == 3000
+        assert patched_github.get_rate_limit.await_count == 2
@@ -1,167 +1,188 @@
 """
 Tests for AI service API endpoints
 """
+import json
+
 import pytest
-from unittest.mock import Mock, patch
-from fastapi.testclient import TestClient
+from unittest.mock import Mock
 
 from app.main import app
+from app.api.v1.ai import get_ai_service
 from app.services.ai_service import AIServiceException, RateLimitException
 from app.schemas.ai import DifficultyLevel, LearningResource
 
 
-client = TestClient(app)
+SUMMARY_URL = "/api/v1/ai/repository-summary"
+EXPLANATION_URL = "/api/v1/ai/issue-explanation"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def make_learning_resources(*types):
+    """One LearningResource per type, numbered from 1"""
+    return [
+        LearningResource(
+            title=f"Resource {n}",
+            url=f"https://example.com/{n}",
+            type=resource_type,
+            description=f"Resource {n} description"
+        )
+        for n, resource_type in enumerate(types, start=1)
+    ]
 
 
 @pytest.fixture
-def auth_headers(test_user_token):
-    """Get authentication headers"""
-    return {"Authorization": f"Bearer {test_user_token}"}
+def auth_headers(auth_headers):
+    """Auth headers plus the content type the pre-serialized bodies need"""
+    return {**auth_headers, **JSON_HEADERS}
+
+
+@pytest.fixture(scope="module")
+def summary_body(shared_repository):
+    """Repository summary request bodies keyed by force_regenerate, serialized once"""
+    return {
+        force: json.dumps({"repository_id": shared_repository.id, "force_regenerate": force}).encode()
+        for force in (False, True)
+    }
+
+
+@pytest.fixture(scope="module")
+def explanation_body(shared_issue):
+    """Issue explanation request bodies keyed by force_regenerate, serialized once"""
+    return {
+        force: json.dumps({"issue_id": shared_issue.id, "force_regenerate": force}).encode()
+        for force in (False, True)
+    }
+
+
+@pytest.fixture(scope="module")
+def shared_ai_service():
+    """One Mock AI service for the module, reset before each test"""
+    return Mock()
 
 
 @pytest.fixture
-def mock_ai_service():
-    """Mock AI service"""
-    with patch('app.api.v1.ai.get_ai_service') as mock:
-        service = Mock()
-        mock.return_value = service
-        yield service
+def mock_ai_service(shared_ai_service):
+    """Mock AI service served through the get_ai_service dependency"""
+    shared_ai_service.reset_mock(return_value=True, side_effect=True)
+    # No cache unless a test sets one up
+    shared_ai_service.redis_client = None
+    shared_ai_service._get_cached_response.return_value = None
+    # The client fixture clears dependency_overrides after every test
+    app.dependency_overrides[get_ai_service] = lambda: shared_ai_service
+    return shared_ai_service
 
 
 class TestRepositorySummaryEndpoint:
     """Test repository summary endpoint"""
     
-    def test_generate_summary_success(self, auth_headers, mock_ai_service, sample_repository):
+    def test_generate_summary_success(self, client, auth_headers, mock_ai_service, shared_repository, summary_body):
         """Test successful repository summary generation"""
-        mock_ai_service.redis_client = None
-        mock_ai_service._get_cached_response.return_value = None
         mock_ai_service.generate_repository_summary.return_value = "This is a test repository summary."
         
         response = client.post(
-            "/api/v1/ai/repository-summary",
-            json={"repository_id": sample_repository.id, "force_regenerate": False},
+            SUMMARY_URL,
+            content=summary_body[False],
             headers=auth_headers
         )
         
-        assert response.status_code == 200
+        assert response.status_code == 200, response.text
         data = response.json()
-        assert data["repository_id"] == sample_repository.id
+        assert data["repository_id"] == shared_repository.id
         assert data["summary"] == "This is a test repository summary."
         assert data["cached"] is False
     
-    def test_generate_summary_from_cache(self, auth_headers, mock_ai_service, sample_repository):
+    def test_generate_summary_from_cache(self, client, auth_headers, mock_ai_service, shared_repository, summary_body):
         """Test repository summary retrieval from cache"""
         mock_ai_service.redis_client = Mock()
         mock_ai_service._get_cached_response.return_value = "Cached summary"
         
         response = client.post(
-            "/api/v1/ai/repository-summary",
-            json={"repository_id": sample_repository.id, "force_regenerate": False},
+            SUMMARY_URL,
+            content=summary_body[False],
             headers=auth_headers
         )
         
-        assert response.status_code == 200
+        assert response.status_code == 200, response.text
         data = response.json()
         assert data["summary"] == "Cached summary"
         assert data["cached"] is True
     
-    def test_generate_summary_force_regenerate(self, auth_headers, mock_ai_service, sample_repository):
+    def test_generate_summary_force_regenerate(self, client, auth_headers, mock_ai_service, shared_repository, summary_body):
         """Test forced regeneration of repository summary"""
-        mock_ai_service.redis_client = None
-        mock_ai_service._get_cached_response.return_value = None
         mock_ai_service.generate_repository_summary.return_value = "New summary"
         
         response = client.post(
-            "/api/v1/ai/repository-summary",
-            json={"repository_id": sample_repository.id, "force_regenerate": True},
+            SUMMARY_URL,
+            content=summary_body[True],
             headers=auth_headers
         )
         
-        assert response.status_code == 200
+        assert response.status_code == 200, response.text
         data = response.json()
         assert data["summary"] == "New summary"
         assert data["cached"] is False
         mock_ai_service.generate_repository_summary.assert_called_once_with(
-            repository_id=sample_repository.id,
+            repository_id=shared_repository.id,
             force_regenerate=True
         )
     
-    def test_generate_summary_rate_limit_exceeded(self, auth_headers, mock_ai_service, sample_repository):
-        """Test rate limit exceeded error"""
-        mock_ai_service.redis_client = None
-        mock_ai_service._get_cached_response.return_value = None
-        mock_ai_service.generate_repository_summary.side_effect = RateLimitException("Rate limit exceeded")
+    @pytest.mark.parametrize("error,status_code,error_code", [
+        (RateLimitException("Rate limit exceeded"), 429, "RATE_LIMIT_EXCEEDED"),
+        (AIServiceException("AI service failed"), 500, "AI_SERVICE_ERROR"),
+    ], ids=["rate_limit_exceeded", "ai_service_error"])
+    def test_generate_summary_error(
+        self, client, auth_headers, mock_ai_service, shared_repository, summary_body,
+        error, status_code, error_code
+    ):
+        """Test AI service errors map to HTTP errors"""
+        mock_ai_service.generate_repository_summary.side_effect = error
         
         response = client.post(
-            "/api/v1/ai/repository-summary",
-            json={"repository_id": sample_repository.id, "force_regenerate": False},
+            SUMMARY_URL,
+            content=summary_body[False],
             headers=auth_headers
         )
         
-        assert response.status_code == 429
+        assert response.status_code == status_code, response.text
         data = response.json()
-        assert data["detail"]["error_code"] == "RATE_LIMIT_EXCEEDED"
+        assert data["detail"]["error_code"] == error_code
     
-    def test_generate_summary_ai_service_error(self, auth_headers, mock_ai_service, sample_repository):
-        """Test AI service error"""
-        mock_ai_service.redis_client = None
-        mock_ai_service._get_cached_response.return_value = None
-        mock_ai_service.generate_repository_summary.side_effect = AIServiceException("AI service failed")
-        
-        response = client.post(
-            "/api/v1/ai/repository-summary",
-            json={"repository_id": sample_repository.id, "force_regenerate": False},
-            headers=auth_headers
-        )
-        
-        assert response.status_code == 500
-        data = response.json()
-        assert data["detail"]["error_code"] == "AI_SERVICE_ERROR"
-    
-    def test_generate_summary_unauthorized(self, sample_repository):
+    def test_generate_summary_unauthorized(self, client, shared_repository, summary_body):
         """Test unauthorized access"""
         response = client.post(
-            "/api/v1/ai/repository-summary",
-            json={"repository_id": sample_repository.id, "force_regenerate": False}
+            SUMMARY_URL,
+            content=summary_body[False],
+            headers=JSON_HEADERS
         )
         
-        assert response.status_code == 401
+        assert response.status_code == 401, response.text
 
 
 class TestIssueExplanationEndpoint:
     """Test issue explanation endpoint"""
     
-    def test_generate_explanation_success(self, auth_headers, mock_ai_service, sample_issue):
+    def test_generate_explanation_success(self, client, auth_headers, mock_ai_service, shared_issue, explanation_body):
         """Test successful issue explanation generation"""
-        mock_ai_service.redis_client = None
-        mock_ai_service._get_cached_response.return_value = None
         mock_ai_service.explain_issue.return_value = "This is a test issue explanation."
         mock_ai_service.analyze_difficulty.return_value = DifficultyLevel.EASY
-        mock_ai_service.suggest_learning_resources.return_value = [
-            LearningResource(
-                title="Test Resource",
-                url="https://example.com",
-                type="tutorial",
-                description="A test resource"
-            )
-        ]
+        mock_ai_service.suggest_learning_resources.return_value = make_learning_resources("tutorial")
         
         response = client.post(
-            "/api/v1/ai/issue-explanation",
-            json={"issue_id": sample_issue.id, "force_regenerate": False},
+            EXPLANATION_URL,
+            content=explanation_body[False],
             headers=auth_headers
         )
         
-        assert response.status_code == 200
+        assert response.status_code == 200, response.text
         data = response.json()
-        assert data["issue_id"] == sample_issue.id
+        assert data["issue_id"] == shared_issue.id
         assert data["explanation"] == "This is a test issue explanation."
         assert data["difficulty_level"] == "easy"
         assert len(data["learning_resources"]) == 1
-        assert data["learning_resources"][0]["title"] == "Test Resource"
+        assert data["learning_resources"][0]["title"] == "Resource 1"
         assert data["cached"] is False
     
-    def test_generate_explanation_from_cache(self, auth_headers, mock_ai_service, sample_issue):
+    def test_generate_explanation_from_cache(self, client, auth_headers, mock_ai_service, shared_issue, explanation_body):
         """Test issue explanation retrieval from cache"""
         mock_ai_service.redis_client = Mock()
         mock_ai_service._get_cached_response.return_value = "Cached explanation"
@@ -169,116 +190,85 @@ class TestIssueExplanationEndpoint:
         mock_ai_service.suggest_learning_resources.return_value = []
         
         response = client.post(
-            "/api/v1/ai/issue-explanation",
-            json={"issue_id": sample_issue.id, "force_regenerate": False},
+            EXPLANATION_URL,
+            content=explanation_body[False],
             headers=auth_headers
         )
         
-        assert response.status_code == 200
+        assert response.status_code == 200, response.text
         data = response.json()
         assert data["explanation"] == "Cached explanation"
         assert data["difficulty_level"] == "medium"
         assert data["cached"] is True
     
-    def test_generate_explanation_force_regenerate(self, auth_headers, mock_ai_service, sample_issue):
+    def test_generate_explanation_force_regenerate(self, client, auth_headers, mock_ai_service, shared_issue, explanation_body):
         """Test forced regeneration of issue explanation"""
-        mock_ai_service.redis_client = None
-        mock_ai_service._get_cached_response.return_value = None
         mock_ai_service.explain_issue.return_value = "New explanation"
         mock_ai_service.analyze_difficulty.return_value = DifficultyLevel.HARD
         mock_ai_service.suggest_learning_resources.return_value = []
         
         response = client.post(
-            "/api/v1/ai/issue-explanation",
-            json={"issue_id": sample_issue.id, "force_regenerate": True},
+            EXPLANATION_URL,
+            content=explanation_body[True],
             headers=auth_headers
         )
         
-        assert response.status_code == 200
+        assert response.status_code == 200, response.text
         data = response.json()
         assert data["explanation"] == "New explanation"
         assert data["difficulty_level"] == "hard"
         assert data["cached"] is False
         mock_ai_service.explain_issue.assert_called_once_with(
-            issue_id=sample_issue.id,
+            issue_id=shared_issue.id,
             force_regenerate=True
         )
     
-    def test_generate_explanation_rate_limit_exceeded(self, auth_headers, mock_ai_service, sample_issue):
-        """Test rate limit exceeded error"""
-        mock_ai_service.redis_client = None
-        mock_ai_service._get_cached_response.return_value = None
-        mock_ai_service.explain_issue.side_effect = RateLimitException("Rate limit exceeded")
-        
-        response = client.post(
-            "/api/v1/ai/issue-explanation",
-            json={"issue_id": sample_issue.id, "force_regenerate": False},
-            headers=auth_headers
-        )
-        
-        assert response.status_code == 429
-        data = response.json()
-        assert data["detail"]["error_code"] == "RATE_LIMIT_EXCEEDED"
-    
-    def test_generate_explanation_ai_service_error(self, auth_headers, mock_ai_service, sample_issue):
-        """Test AI service error"""
-        mock_ai_service.redis_client = None
-        mock_ai_service._get_cached_response.return_value = None
-        mock_ai_service.explain_issue.side_effect = AIServiceException("AI service failed")
+    @pytest.mark.parametrize("error,status_code,error_code", [
+        (RateLimitException("Rate limit exceeded"), 429, "RATE_LIMIT_EXCEEDED"),
+        (AIServiceException("AI service failed"), 500, "AI_SERVICE_ERROR"),
+    ], ids=["rate_limit_exceeded", "ai_service_error"])
+    def test_generate_explanation_error(
+        self, client, auth_headers, mock_ai_service, shared_issue, explanation_body,
+        error, status_code, error_code
+    ):
+        """Test AI service errors map to HTTP errors"""
+        mock_ai_service.explain_issue.side_effect = error
         
         response = client.post(
-            "/api/v1/ai/issue-explanation",
-            json={"issue_id": sample_issue.id, "force_regenerate": False},
+            EXPLANATION_URL,
+            content=explanation_body[False],
             headers=auth_headers
         )
         
-        assert response.status_code == 500
+        assert response.status_code == status_code, response.text
         data = response.json()
-        assert data["detail"]["error_code"] == "AI_SERVICE_ERROR"
+        assert data["detail"]["error_code"] == error_code
     
-    def test_generate_explanation_unauthorized(self, sample_issue):
+    def test_generate_explanation_unauthorized(self, client, shared_issue, explanation_body):
         """Test unauthorized access"""
         response = client.post(
-            "/api/v1/ai/issue-explanation",
-            json={"issue_id": sample_issue.id, "force_regenerate": False}
+            EXPLANATION_URL,
+            content=explanation_body[False],
+            headers=JSON_HEADERS
         )
         
-        assert response.status_code == 401
+        assert response.status_code == 401, response.text
     
-    def test_generate_explanation_with_multiple_resources(self, auth_headers, mock_ai_service, sample_issue):
+    def test_generate_explanation_with_multiple_resources(self, client, auth_headers, mock_ai_service, shared_issue, explanation_body):
         """Test issue explanation with multiple learning resources"""
-        mock_ai_service.redis_client = None
-        mock_ai_service._get_cached_response.return_value = None
         mock_ai_service.explain_issue.return_value = "Explanation"
         mock_ai_service.analyze_difficulty.return_value = DifficultyLevel.MEDIUM
-        mock_ai_service.suggest_learning_resources.return_value = [
-            LearningResource(
-                title="Resource 1",
-                url="https://example.com/1",
-                type="documentation",
-                description="First resource"
-            ),
-            LearningResource(
-                title="Resource 2",
-                url="https://example.com/2",
-                type="tutorial",
-                description="Second resource"
-            ),
-            LearningResource(
-                title="Resource 3",
-                url="https://example.com/3",
-                type="video",
-                description="Third resource"
-            )
-        ]
+        mock_ai_service.suggest_learning_resources.return_value = make_learning_resources(
+            "documentation", "tutorial", "video"
+        )
         
         response = client.post(
-            "/api/v1/ai/issue-explanation",
-            json={"issue_id": sample_issue.id, "force_regenerate": False},
+            EXPLANATION_URL,
+            content=explanation_body[False],
             headers=auth_headers
         )
         
-        assert response.status_code == 200
+        assert response.status_code == 200, response.text
         data = response.json()
         assert len(data["learning_resources"]) == 3
         assert data["learning_resources"][0]["type"] == "documentation"
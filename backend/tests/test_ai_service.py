@@ -26,51 +26,35 @@ def mock_redis():
 
 
 @pytest.fixture
-def sample_repository(db_session):
-    """Create a sample repository"""
-    repo = Repository(
-        github_repo_id=12345,
-        full_name="test-org/test-repo",
-        name="test-repo",
-        description="A test repository for unit testing",
-        primary_language="Python",
-        topics=["testing", "python", "open-source"],
-        stars=100,
-        forks=20,
-        is_active=True
-    )
-    db_session.add(repo)
-    db_session.commit()
-    db_session.refresh(repo)
-    return repo
+def sample_repository(db_session, shared_repository):
+    """The module's shared repository, loaded in the test's rolled-back session"""
+    return db_session.get(Repository, shared_repository.id)
 
 
 @pytest.fixture
-def sample_issue(db_session, sample_repository):
-    """Create a sample issue"""
-    issue = Issue(
-        github_issue_id=67890,
-        repository_id=sample_repository.id,
-        title="Add unit tests for authentication module",
-        description="We need comprehensive unit tests for the authentication module to improve code coverage.",
-        labels=["good first issue", "testing", "help wanted"],
-        programming_language="Python",
-        status=IssueStatus.AVAILABLE,
-        github_url="https://github.com/test-org/test-repo/issues/1"
-    )
-    db_session.add(issue)
-    db_session.commit()
-    db_session.refresh(issue)
-    return issue
+def sample_issue(db_session, shared_issue):
+    """The module's shared issue, loaded in the test's rolled-back session"""
+    return db_session.get(Issue, shared_issue.id)
 
 
-@pytest.fixture
-def ai_service(db_session, mock_redis):
-    """Create AI service instance with mocked dependencies"""
+@pytest.fixture(scope="module")
+def shared_ai_service():
+    """AIService built once for the module; setting up its client is the costly part"""
     with patch('app.services.ai_service.settings') as mock_settings:
         mock_settings.OPENAI_API_KEY = "test-api-key"
-        service = AIService(db=db_session, redis_client=mock_redis)
-        return service
+        return AIService(db=None)
+
+
+@pytest.fixture
+def ai_service(shared_ai_service, db_session, mock_redis):
+    """The shared AI service bound to this test's session, with its cache_service mocked"""
+    initial_state = dict(vars(shared_ai_service))
+    shared_ai_service.db = db_session
+    with patch('app.services.ai_service.cache_service', mock_redis):
+        yield shared_ai_service
+    # Undo anything the test set on the shared instance (db, client, limits)
+    vars(shared_ai_service).clear()
+    vars(shared_ai_service).update(initial_state)
 
 
 class TestAIServiceInitialization:
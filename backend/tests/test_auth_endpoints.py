@@ -1,56 +1,15 @@
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch, AsyncMock
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
-from app.main import app
-from app.db.base import Base
-from app.api.dependencies import get_db
 from app.models.user import User
 from app.schemas.auth import GitHubUserData
 
 
-# Create in-memory SQLite database for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-
-def override_get_db():
-    """Override database dependency for testing"""
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
-
-
-# Override the dependency
-app.dependency_overrides[get_db] = override_get_db
-
-# Create test client
-client = TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def setup_database():
-    """Create tables before each test and drop after"""
-    Base.metadata.create_all(bind=engine)
-    yield
-    Base.metadata.drop_all(bind=engine)
-
-
 class TestAuthEndpoints:
     """Integration tests for authentication endpoints"""
     
     @pytest.mark.asyncio
-    async def test_github_callback_new_user(self):
+    async def test_github_callback_new_user(self, client):
         """
         Test GitHub OAuth callback creates new user
         Requirements: 1.1, 1.2
@@ -83,13 +42,12 @@ class TestAuthEndpoints:
             assert data["token_type"] == "bearer"
     
     @pytest.mark.asyncio
-    async def test_github_callback_existing_user(self):
+    async def test_github_callback_existing_user(self, client, db_session):
         """
         Test GitHub OAuth callback logs in existing user
         Requirement: 1.4
         """
         # Create existing user in database
-        db = TestingSessionLocal()
         existing_user = User(
             github_username="existinguser",
             github_id=99999,
@@ -101,9 +59,8 @@ class TestAuthEndpoints:
             total_contributions=5,
             merged_prs=3
         )
-        db.add(existing_user)
-        db.commit()
-        db.close()
+        db_session.add(existing_user)
+        db_session.commit()
         
         github_user_data = GitHubUserData(
             login="existinguser",
@@ -129,16 +86,13 @@ class TestAuthEndpoints:
             assert "access_token" in data
             
             # Verify user stats were preserved
-            db = TestingSessionLocal()
-            user = db.query(User).filter(User.github_id == 99999).first()
+            user = db_session.query(User).filter(User.github_id == 99999).first()
             assert user.total_contributions == 5
             assert user.merged_prs == 3
-            db.close()
     
-    def test_get_current_user_authenticated(self):
+    def test_get_current_user_authenticated(self, client, db_session):
         """Test getting current user info with valid token"""
         # Create user and generate token
-        db = TestingSessionLocal()
         user = User(
             github_username="testuser",
             github_id=12345,
@@ -150,9 +104,8 @@ class TestAuthEndpoints:
             total_contributions=0,
             merged_prs=0
         )
-        db.add(user)
-        db.commit()
-        db.refresh(user)
+        db_session.add(user)
+        db_session.commit()
         
         from app.core.security import create_access_token
         token = create_access_token({
@@ -160,7 +113,6 @@ class TestAuthEndpoints:
             "github_username": user.github_username,
             "github_id": user.github_id
         })
-        db.close()
         
         response = client.get(
             "/api/v1/auth/me",
@@ -174,13 +126,13 @@ class TestAuthEndpoints:
         assert data["email"] == "test@example.com"
         assert "Python" in data["preferred_languages"]
     
-    def test_get_current_user_unauthenticated(self):
+    def test_get_current_user_unauthenticated(self, client):
         """Test getting current user info without token"""
         response = client.get("/api/v1/auth/me")
         
         assert response.status_code == 403  # No credentials provided
     
-    def test_get_current_user_invalid_token(self):
+    def test_get_current_user_invalid_token(self, client):
         """Test getting current user info with invalid token"""
         response = client.get(
             "/api/v1/auth/me",
@@ -189,10 +141,9 @@ class TestAuthEndpoints:
         
         assert response.status_code == 401
     
-    def test_refresh_token_success(self):
+    def test_refresh_token_success(self, client, db_session):
         """Test token refresh with valid refresh token"""
         # Create user and generate tokens
-        db = TestingSessionLocal()
         user = User(
             github_username="testuser",
             github_id=12345,
@@ -204,9 +155,8 @@ class TestAuthEndpoints:
             total_contributions=0,
             merged_prs=0
         )
-        db.add(user)
-        db.commit()
-        db.refresh(user)
+        db_session.add(user)
+        db_session.commit()
         
         from app.core.security import create_refresh_token
         refresh_token = create_refresh_token({
@@ -214,7 +164,6 @@ class TestAuthEndpoints:
             "github_username": user.github_username,
             "github_id": user.github_id
         })
-        db.close()
         
         response = client.post(
             "/api/v1/auth/refresh",
@@ -226,7 +175,7 @@ class TestAuthEndpoints:
         assert "access_token" in data
         assert "refresh_token" in data
     
-    def test_refresh_token_invalid(self):
+    def test_refresh_token_invalid(self, client):
         """Test token refresh with invalid refresh token"""
         response = client.post(
             "/api/v1/auth/refresh",
@@ -235,10 +184,9 @@ class TestAuthEndpoints:
         
         assert response.status_code == 401
     
-    def test_logout(self):
+    def test_logout(self, client, db_session):
         """Test logout endpoint"""
         # Create user and generate token
-        db = TestingSessionLocal()
         user = User(
             github_username="testuser",
             github_id=12345,
@@ -250,9 +198,8 @@ class TestAuthEndpoints:
             total_contributions=0,
             merged_prs=0
         )
-        db.add(user)
-        db.commit()
-        db.refresh(user)
+        db_session.add(user)
+        db_session.commit()
         
         from app.core.security import create_access_token
         token = create_access_token({
@@ -260,7 +207,6 @@ class TestAuthEndpoints:
             "github_username": user.github_username,
             "github_id": user.github_id
         })
-        db.close()
         
         response = client.post(
             "/api/v1/auth/logout",
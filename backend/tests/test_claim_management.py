@@ -3,6 +3,7 @@ Comprehensive tests for issue claim management system
 """
 import pytest
 from datetime import datetime, timedelta
+from unittest.mock import patch
 from app.services.issue_service import IssueService
 from app.models.issue import Issue, IssueStatus
 from app.models.user import User
@@ -450,6 +451,61 @@ class TestAutoReleaseExpiredClaims:
         assert easy_issue.status == IssueStatus.AVAILABLE
         assert medium_issue.status == IssueStatus.CLAIMED
     
+    def test_auto_release_spans_multiple_chunks(self, issue_service, easy_issue, medium_issue, hard_issue, test_user):
+        """Test auto-release walks every chunk when expired claims exceed the chunk size"""
+        for issue in [easy_issue, medium_issue, hard_issue]:
+            issue_service.claim_issue(issue.id, test_user.id)
+            issue.claim_expires_at = datetime.utcnow() - timedelta(hours=1)
+        issue_service.db.commit()
+        
+        result = issue_service.auto_release_expired_claims(chunk_size=2)
+        
+        assert result.released_count == 3
+        assert sorted(result.issue_ids) == sorted([easy_issue.id, medium_issue.id, hard_issue.id])
+    
+    def test_auto_release_rerun_releases_nothing(self, issue_service, easy_issue, medium_issue, test_user):
+        """Test a repeated auto-release run leaves already-released issues alone"""
+        for issue in [easy_issue, medium_issue]:
+            issue_service.claim_issue(issue.id, test_user.id)
+            issue.claim_expires_at = datetime.utcnow() - timedelta(hours=1)
+        issue_service.db.commit()
+        
+        first = issue_service.auto_release_expired_claims()
+        second = issue_service.auto_release_expired_claims()
+        
+        assert first.released_count == 2
+        assert second.released_count == 0
+        assert second.errors == []
+    
+    def test_auto_release_commits_each_chunk(self, issue_service, easy_issue, medium_issue, hard_issue, test_user):
+        """Test every chunk of released claims is committed on its own"""
+        for issue in [easy_issue, medium_issue, hard_issue]:
+            issue_service.claim_issue(issue.id, test_user.id)
+            issue.claim_expires_at = datetime.utcnow() - timedelta(hours=1)
+        issue_service.db.commit()
+        
+        with patch.object(issue_service.db, 'commit', wraps=issue_service.db.commit) as mock_commit:
+            issue_service.auto_release_expired_claims(chunk_size=2)
+        
+        # One full chunk of 2, then the final partial chunk of 1
+        assert mock_commit.call_count == 2
+    
+    def test_auto_release_log_caps_issue_ids(
+        self, issue_service, easy_issue, medium_issue, hard_issue, test_user, caplog, monkeypatch
+    ):
+        """Test the completion log gives the count and only a capped sample of ids"""
+        monkeypatch.setattr("app.services.issue_service.AUTO_RELEASE_LOG_SAMPLE", 2)
+        for issue in [easy_issue, medium_issue, hard_issue]:
+            issue_service.claim_issue(issue.id, test_user.id)
+            issue.claim_expires_at = datetime.utcnow() - timedelta(hours=1)
+        issue_service.db.commit()
+        
+        with caplog.at_level("INFO", logger="app.services.issue_service"):
+            result = issue_service.auto_release_expired_claims()
+        
+        message = next(r.getMessage() for r in caplog.records if "Auto-release completed" in r.getMessage())
+        assert message.endswith(f"3 issues released (first 2: {result.issue_ids[:2]})")
+    
     def test_auto_release_no_expired_claims(self, issue_service):
         """Test auto-release when there are no expired claims"""
         result = issue_service.auto_release_expired_claims()
@@ -548,6 +604,21 @@ class TestGetExpiringClaims:
         expiring_12h = issue_service.get_expiring_claims(hours_threshold=12)
         assert len(expiring_12h) == 1
         assert expiring_12h[0].id == sample_issue.id
+    
+    def test_get_expiring_claims_with_hours_remaining(self, issue_service, easy_issue, medium_issue, test_user):
+        """Test hours remaining are computed in SQL and ordered by soonest expiry"""
+        issue_service.claim_issue(easy_issue.id, test_user.id)
+        issue_service.claim_issue(medium_issue.id, test_user.id)
+        
+        easy_issue.claim_expires_at = datetime.utcnow() + timedelta(hours=20)
+        medium_issue.claim_expires_at = datetime.utcnow() + timedelta(hours=10)
+        issue_service.db.commit()
+        
+        expiring = issue_service.get_expiring_claims_with_hours_remaining(hours_threshold=24)
+        
+        assert [issue.id for issue, _ in expiring] == [medium_issue.id, easy_issue.id]
+        assert 9.9 < expiring[0][1] <= 10
+        assert 19.9 < expiring[1][1] <= 20
 
 
 class TestClaimManagementEdgeCases:
@@ -0,0 +1,120 @@
+"""
+Tests for the closed issues check
+"""
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from app.tasks.sync_tasks import check_closed_issues_task, _get_issue_state
+from app.services.github_service import GitHubAPIError
+from app.models.issue import Issue, IssueStatus
+
+
+@pytest.fixture
+def make_issue(db_session, sample_repository):
+    """Factory for open issues pointing at a GitHub issue URL"""
+    def make(number, repo="test-org/test-repo", github_url=None):
+        issue = Issue(
+            github_issue_id=70000 + number,
+            repository_id=sample_repository.id,
+            title=f"Issue {number}",
+            labels=["good first issue"],
+            status=IssueStatus.AVAILABLE,
+            github_url=github_url or f"https://github.com/{repo}/issues/{number}"
+        )
+        db_session.add(issue)
+        db_session.commit()
+        return issue.id
+    return make
+
+
+@pytest.fixture
+def github_service(db_session):
+    """
+    Run the task on the test session against a mocked, token-bearing GitHubService.
+
+    The REST state memo is cleared around each test so lookups never leak
+    between them.
+    """
+    service = MagicMock()
+    service.access_token = "test_token"
+    service.get_issue_states = AsyncMock(return_value={})
+    service.check_issue_status = AsyncMock(return_value="open")
+    _get_issue_state.cache_clear()
+    with patch('app.tasks.sync_tasks.SessionLocal', return_value=db_session), \
+         patch('app.tasks.sync_tasks.get_github_service', return_value=service):
+        yield service
+    _get_issue_state.cache_clear()
+
+
+def _status(db_session, issue_id):
+    """Issue status as committed by the task, which closes its session"""
+    return db_session.get(Issue, issue_id).status
+
+
+class TestCheckClosedIssuesTask:
+    """Tests for check_closed_issues_task"""
+    
+    def test_token_uses_one_graphql_query_per_repo(self, db_session, make_issue, github_service):
+        """Test issues are grouped by repository and looked up with GraphQL"""
+        closed_id = make_issue(1)
+        open_id = make_issue(2)
+        other_repo_id = make_issue(5, repo="other-org/other-repo")
+        states = {
+            "test-org/test-repo": {1: "closed", 2: "open"},
+            "other-org/other-repo": {5: "open"},
+        }
+        github_service.get_issue_states.side_effect = lambda repo, numbers: states[repo]
+        
+        result = check_closed_issues_task()
+        
+        assert result == {"success": True, "issues_checked": 3, "issues_closed": 1}
+        assert github_service.get_issue_states.await_count == 2
+        calls = {c.args[0]: sorted(c.args[1]) for c in github_service.get_issue_states.await_args_list}
+        assert calls == {"test-org/test-repo": [1, 2], "other-org/other-repo": [5]}
+        github_service.check_issue_status.assert_not_awaited()
+        assert _status(db_session, closed_id) == IssueStatus.CLOSED
+        assert _status(db_session, open_id) == IssueStatus.AVAILABLE
+        assert _status(db_session, other_repo_id) == IssueStatus.AVAILABLE
+    
+    def test_tokenless_uses_rest(self, db_session, make_issue, github_service):
+        """Test each issue is checked over REST when no token is configured"""
+        closed_id = make_issue(1)
+        open_id = make_issue(2)
+        github_service.access_token = None
+        github_service.check_issue_status.side_effect = (
+            lambda repo, number: "closed" if number == 1 else "open"
+        )
+        
+        result = check_closed_issues_task()
+        
+        assert result["issues_closed"] == 1
+        github_service.get_issue_states.assert_not_awaited()
+        assert github_service.check_issue_status.await_count == 2
+        assert _status(db_session, closed_id) == IssueStatus.CLOSED
+        assert _status(db_session, open_id) == IssueStatus.AVAILABLE
+    
+    def test_graphql_failure_falls_back_to_rest(self, db_session, make_issue, github_service):
+        """Test a failed GraphQL query is retried per issue over REST"""
+        closed_id = make_issue(1)
+        github_service.get_issue_states.side_effect = GitHubAPIError("GraphQL query failed")
+        github_service.check_issue_status.return_value = "closed"
+        
+        result = check_closed_issues_task()
+        
+        assert result["success"] is True
+        assert result["issues_closed"] == 1
+        github_service.check_issue_status.assert_awaited_once_with("test-org/test-repo", 1)
+        assert _status(db_session, closed_id) == IssueStatus.CLOSED
+    
+    def test_unparseable_url_is_skipped(self, db_session, make_issue, github_service):
+        """Test an issue with an unparseable URL is counted but not looked up"""
+        bad_url_id = make_issue(1, github_url="https://example.com/not-an-issue")
+        closed_id = make_issue(2)
+        github_service.get_issue_states.return_value = {2: "closed"}
+        
+        result = check_closed_issues_task()
+        
+        assert result == {"success": True, "issues_checked": 2, "issues_closed": 1}
+        github_service.get_issue_states.assert_awaited_once_with("test-org/test-repo", [2])
+        assert _status(db_session, bad_url_id) == IssueStatus.AVAILABLE
+        assert _status(db_session, closed_id) == IssueStatus.CLOSED
@@ -2,27 +2,25 @@
 Tests for dashboard endpoints
 """
 import pytest
-from fastapi.testclient import TestClient
 from datetime import datetime
 from sqlalchemy.orm import Session
 
-from app.main import app
 from app.models.user import User
 from app.models.repository import Repository
 from app.models.issue import Issue, IssueStatus
 from app.models.contribution import Contribution, ContributionStatus
 from app.services.achievement_service import AchievementService
+from app.services.cache_service import cache_service, CacheKeys
 
 
-client = TestClient(app)
-
 
 class TestDashboardEndpoints:
     """Test dashboard API endpoints"""
     
     def test_get_user_stats(
         self,
-        db: Session,
+        client,
+        db_session: Session,
         test_user: User,
         auth_headers: dict
     ):
@@ -46,13 +44,14 @@ class TestDashboardEndpoints:
     
     def test_get_user_achievements(
         self,
-        db: Session,
+        client,
+        db_session: Session,
         test_user: User,
         auth_headers: dict
     ):
         """Test getting user achievements"""
         # Initialize achievements
-        service = AchievementService(db)
+        service = AchievementService(db_session)
         service.initialize_achievements()
         
         response = client.get(
@@ -83,14 +82,15 @@ class TestDashboardEndpoints:
     
     def test_get_user_dashboard(
         self,
-        db: Session,
+        client,
+        db_session: Session,
         test_user: User,
         test_repository: Repository,
         auth_headers: dict
     ):
         """Test getting comprehensive dashboard data"""
         # Initialize achievements
-        service = AchievementService(db)
+        service = AchievementService(db_session)
         service.initialize_achievements()
         
         # Create some contributions
@@ -105,8 +105,8 @@ class TestDashboardEndpoints:
                 status=IssueStatus.COMPLETED,
                 github_url=f"https://github.com/test/repo/issues/{i}"
             )
-            db.add(issue)
-            db.flush()
+            db_session.add(issue)
+            db_session.flush()
             
             contribution = Contribution(
                 user_id=test_user.id,
@@ -117,9 +117,9 @@ class TestDashboardEndpoints:
                 merged_at=datetime.utcnow(),
                 points_earned=100
             )
-            db.add(contribution)
+            db_session.add(contribution)
         
-        db.commit()
+        db_session.commit()
         
         # Award achievements
         service.check_and_award_achievements(test_user.id)
@@ -162,7 +162,8 @@ class TestDashboardEndpoints:
     
     def test_get_user_stats_with_contributions(
         self,
-        db: Session,
+        client,
+        db_session: Session,
         test_user: User,
         test_repository: Repository,
         auth_headers: dict
@@ -182,8 +183,8 @@ class TestDashboardEndpoints:
                 status=IssueStatus.COMPLETED,
                 github_url=f"https://github.com/test/repo/issues/{i}"
             )
-            db.add(issue)
-            db.flush()
+            db_session.add(issue)
+            db_session.flush()
             
             contribution = Contribution(
                 user_id=test_user.id,
@@ -194,9 +195,9 @@ class TestDashboardEndpoints:
                 merged_at=datetime.utcnow() if i < 2 else None,
                 points_earned=100 if i < 2 else 10
             )
-            db.add(contribution)
+            db_session.add(contribution)
         
-        db.commit()
+        db_session.commit()
         
         response = client.get(
             "/api/v1/users/me/stats",
@@ -221,7 +222,8 @@ class TestDashboardEndpoints:
     
     def test_get_public_user_stats(
         self,
-        db: Session,
+        client,
+        db_session: Session,
         test_user: User
     ):
         """Test getting public user statistics by ID"""
@@ -237,12 +239,13 @@ class TestDashboardEndpoints:
     
     def test_get_public_user_achievements(
         self,
-        db: Session,
+        client,
+        db_session: Session,
         test_user: User
     ):
         """Test getting public user achievements by ID"""
         # Initialize achievements
-        service = AchievementService(db)
+        service = AchievementService(db_session)
         service.initialize_achievements()
         
         response = client.get(f"/api/v1/users/{test_user.id}/achievements")
@@ -253,7 +256,7 @@ class TestDashboardEndpoints:
         assert isinstance(data, list)
         assert len(data) > 0
     
-    def test_dashboard_unauthorized(self):
+    def test_dashboard_unauthorized(self, client):
         """Test dashboard endpoints require authentication"""
         response = client.get("/api/v1/users/me/dashboard")
         assert response.status_code == 401
@@ -266,13 +269,14 @@ class TestDashboardEndpoints:
     
     def test_dashboard_with_no_data(
         self,
-        db: Session,
+        client,
+        db_session: Session,
         test_user: User,
         auth_headers: dict
     ):
         """Test dashboard with user who has no contributions"""
         # Initialize achievements
-        service = AchievementService(db)
+        service = AchievementService(db_session)
         service.initialize_achievements()
         
         response = client.get(
@@ -307,9 +311,10 @@ def test_user(db_session: Session) -> User:
         total_contributions=0,
         merged_prs=0
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    db_session.add(user)
+    db_session.commit()
+    # Rolled-back ids are reused, so drop stats cached under a previous test
+    cache_service.delete(CacheKeys.user_stats(user.id))
     return user
 
 
@@ -326,16 +331,6 @@ def test_repository(db_session: Session) -> Repository:
         forks=20,
         is_active=True
     )
-    db.add(repo)
-    db.commit()
-    db.refresh(repo)
+    db_session.add(repo)
+    db_session.commit()
     return repo
-
-
-@pytest.fixture
-def auth_headers(test_user: User) -> dict:
-    """Create authentication headers for test user"""
-    # This is a simplified version - in real tests, you'd generate a proper JWT token
-    return {
-        "Authorization": f"Bearer test_token_for_user_{test_user.id}"
-    }
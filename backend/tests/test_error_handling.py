@@ -2,7 +2,6 @@
 Tests for error handling and logging functionality.
 """
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.main import app
@@ -19,7 +18,11 @@ from app.core.exceptions import (
 )
 
 
-client = TestClient(app)
+@pytest.fixture
+def client(session_client):
+    """Session-wide test client; nothing here touches the database"""
+    session_client.cookies.clear()
+    return session_client
 
 
 class TestCustomExceptions:
@@ -93,18 +96,18 @@ class TestCustomExceptions:
 class TestErrorHandlers:
     """Test error handler middleware."""
     
-    def test_health_check_endpoint(self):
+    def test_health_check_endpoint(self, client):
         """Test health check endpoint works."""
         response = client.get("/health")
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
     
-    def test_not_found_endpoint(self):
+    def test_not_found_endpoint(self, client):
         """Test 404 error for non-existent endpoint."""
         response = client.get("/api/v1/nonexistent")
         assert response.status_code == 404
     
-    def test_validation_error_response_format(self):
+    def test_validation_error_response_format(self, client):
         """Test validation error response format."""
         # This would require an endpoint that validates input
         # For now, we'll test the structure
@@ -124,14 +127,14 @@ class TestErrorHandlers:
 class TestRateLimiting:
     """Test rate limiting functionality."""
     
-    def test_rate_limit_headers(self):
+    def test_rate_limit_headers(self, client):
         """Test rate limit headers are present."""
         response = client.get("/api/v1/issues")
         # Should have rate limit headers
         assert "X-RateLimit-Limit" in response.headers or response.status_code == 401
         assert "X-RateLimit-Window" in response.headers or response.status_code == 401
     
-    def test_rate_limit_exceeded(self):
+    def test_rate_limit_exceeded(self, client):
         """Test rate limit enforcement."""
         # Make many requests quickly
         responses = []
@@ -149,7 +152,7 @@ class TestRateLimiting:
 class TestRequestLogging:
     """Test request logging middleware."""
     
-    def test_request_id_header(self):
+    def test_request_id_header(self, client):
         """Test request ID is added to response."""
         response = client.get("/health")
         assert "X-Request-ID" in response.headers
@@ -159,7 +162,7 @@ class TestRequestLogging:
 class TestErrorResponseFormat:
     """Test error response format consistency."""
     
-    def test_error_response_structure(self):
+    def test_error_response_structure(self, client):
         """Test error responses have consistent structure."""
         # Test with a non-existent endpoint
         response = client.get("/api/v1/nonexistent")
@@ -386,6 +386,57 @@ class TestWebhookSetup:
             assert call_args[1]["json_data"]["events"] == ["issues", "pull_request", "push"]
 
 
+class TestGetIssueStates:
+    """Test batched issue state lookups"""
+
+    @pytest.mark.asyncio
+    async def test_get_issue_states_single_query(self, github_service):
+        """Test issue states are fetched in one GraphQL request"""
+        mock_data = {
+            "data": {
+                "repository": {
+                    "i1": {"number": 1, "state": "OPEN"},
+                    "i2": {"number": 2, "state": "CLOSED"},
+                    "i3": None
+                }
+            }
+        }
+
+        with patch.object(github_service, '_make_request', return_value=mock_data) as mock_request:
+            states = await github_service.get_issue_states("owner/repo", [1, 2, 3])
+
+            assert states == {1: "open", 2: "closed"}
+            mock_request.assert_called_once()
+            assert mock_request.call_args[0] == ("POST", "/graphql")
+
+    @pytest.mark.asyncio
+    async def test_graphql_request_keeps_core_rate_limit(self, github_service, mock_response):
+        """Test GraphQL rate limit headers don't overwrite the REST core limit"""
+        core_limit = RateLimitInfo(
+            limit=5000,
+            remaining=0,
+            reset=datetime.fromtimestamp(datetime.now().timestamp() + 3600),
+            used=5000
+        )
+        github_service.rate_limit_info = core_limit
+        mock_response.json.return_value = {"data": {"repository": {}}}
+        mock_client = AsyncMock()
+        mock_client.request.return_value = mock_response
+
+        with patch.object(github_service, '_get_client', return_value=mock_client):
+            await github_service._make_request("POST", "/graphql", json_data={"query": "{}"})
+
+        assert github_service.rate_limit_info is core_limit
+
+    @pytest.mark.asyncio
+    async def test_get_issue_states_requires_token(self):
+        """Test GraphQL lookups are refused without a token"""
+        service = GitHubService()
+
+        with pytest.raises(GitHubAPIError):
+            await service.get_issue_states("owner/repo", [1])
+
+
 class TestErrorHandling:
     """Test error handling"""
     
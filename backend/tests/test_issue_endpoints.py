@@ -7,8 +7,7 @@ from unittest.mock import Mock, AsyncMock
 from datetime import datetime
 
 from app.main import app
-from app.models.issue import Issue, IssueStatus
-from app.models.repository import Repository
+from app.models.issue import IssueStatus
 from app.api.v1.issues import get_issue_service
 
 
@@ -35,7 +34,7 @@ def client(mock_issue_service):
 @pytest.fixture
 def sample_issue():
     """Sample issue for testing"""
-    issue = Mock(spec=Issue)
+    issue = Mock()
     issue.id = 1
     issue.github_issue_id = 67890
     issue.repository_id = 1
@@ -54,7 +53,7 @@ def sample_issue():
     issue.updated_at = datetime.utcnow()
     
     # Mock repository relationship
-    repo = Mock(spec=Repository)
+    repo = Mock()
     repo.name = "repo"
     repo.full_name = "test/repo"
     issue.repository = repo
@@ -3,7 +3,11 @@ Performance tests for caching and optimization features.
 """
 import pytest
 import time
-from app.services.cache_service import cache_service, CacheKeys, CacheTTL
+from unittest.mock import Mock, AsyncMock, patch
+from app.services.cache_service import (
+    cache_service, CacheKeys, CacheTTL, CacheInvalidationBus, InMemoryCache,
+    async_ttl_cache
+)
 from app.core.performance import timer, measure_time, performance_monitor
 
 
@@ -54,6 +58,17 @@ class TestCacheService:
         cache_service.delete(key)
         assert cache_service.exists(key) is False
     
+    def test_cache_delete_many(self):
+        """Test deleting multiple keys in one call."""
+        cache_service.set("test:many:1", {"id": 1})
+        cache_service.set("test:many:2", {"id": 2})
+        
+        deleted = cache_service.delete_many("test:many:1", "test:many:2", "test:many:missing")
+        assert deleted == 2
+        
+        assert cache_service.exists("test:many:1") is False
+        assert cache_service.exists("test:many:2") is False
+    
     def test_cache_delete_pattern(self):
         """Test pattern-based cache deletion."""
         # Set multiple keys
@@ -69,6 +84,19 @@ class TestCacheService:
         assert cache_service.get("user:1:stats") is None
         assert cache_service.get("user:2:stats") is None
     
+    def test_cache_purge_expired(self):
+        """Test expired keys are evicted without being read."""
+        cache = InMemoryCache()
+        now = time.time()
+        with patch('app.services.cache_service.time.time', return_value=now):
+            for i in range(InMemoryCache.SCAN_BATCH_SIZE + 5):
+                cache.set(f"test:purge:{i}", i, ttl=1)
+            cache.set("test:purge:live", "live", ttl=60)
+        
+        with patch('app.services.cache_service.time.time', return_value=now + 2):
+            assert cache.purge_expired() == InMemoryCache.SCAN_BATCH_SIZE + 5
+        assert cache._store.keys() == {"test:purge:live"}
+    
     def test_cache_get_many(self):
         """Test getting multiple cache values."""
         keys = ["test:multi:1", "test:multi:2", "test:multi:3"]
@@ -138,6 +166,111 @@ class TestCacheService:
         assert CacheTTL.DAY == 86400
 
 
+class TestAsyncTTLCache:
+    """Test memoization of async lookups."""
+    
+    @pytest.mark.asyncio
+    async def test_results_are_reused_until_expiry(self):
+        """Repeat calls within the TTL reuse the first result, including None."""
+        calls = []
+        
+        @async_ttl_cache(ttl=1)
+        async def lookup(repo, number):
+            calls.append((repo, number))
+            return None if number == 2 else "open"
+        
+        now = time.monotonic()
+        with patch('app.services.cache_service.time.monotonic', return_value=now):
+            assert await lookup("owner/repo", 1) == "open"
+            assert await lookup("owner/repo", 1) == "open"
+            assert await lookup("owner/repo", 2) is None
+            assert await lookup("owner/repo", 2) is None
+            assert len(calls) == 2
+        
+        with patch('app.services.cache_service.time.monotonic', return_value=now + 2):
+            await lookup("owner/repo", 1)
+            assert len(calls) == 3
+    
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self):
+        """Entries beyond maxsize are evicted oldest first."""
+        calls = []
+        
+        @async_ttl_cache(maxsize=2)
+        async def lookup(number):
+            calls.append(number)
+            return number
+        
+        for number in (1, 2, 3, 1):
+            await lookup(number)
+        assert calls == [1, 2, 3, 1]
+
+
+class TestPRSweepMemo:
+    """Test pull request reuse within one open-PR sweep."""
+    
+    @pytest.mark.asyncio
+    async def test_sweep_cache_is_shared_but_single_checks_are_fresh(self):
+        """A sweep's cache reuses fetched PRs; checks without one always fetch."""
+        from types import SimpleNamespace
+        from app.tasks.pr_tasks import _check_pr
+        
+        contribution = SimpleNamespace(
+            id=1, issue_id=1, pr_url="https://github.com/owner/repo/pull/7",
+            status=None, merged_at=None
+        )
+        github = Mock()
+        github.get_pull_request = AsyncMock(
+            return_value=Mock(merged=False, state="open", merged_at=None)
+        )
+        
+        with patch('app.tasks.pr_tasks.get_github_service', return_value=github):
+            pr_cache = {}
+            await _check_pr(contribution, pr_cache)
+            await _check_pr(contribution, pr_cache)
+            assert github.get_pull_request.await_count == 1
+            
+            await _check_pr(contribution)
+            await _check_pr(contribution)
+            assert github.get_pull_request.await_count == 3
+
+
+class TestCacheInvalidationBus:
+    """Test cross-process cache invalidation fan-out."""
+    
+    def test_invalidate_without_redis_is_local(self):
+        """Without Redis, invalidation only touches the local cache."""
+        cache = InMemoryCache()
+        bus = CacheInvalidationBus(cache)
+        cache.set("user:stats:1", {"count": 1})
+        
+        with patch('app.services.cache_service.get_redis_client', return_value=None):
+            assert bus.connect() is False
+        assert bus.invalidate("user:stats:1") == 1
+        assert cache.get("user:stats:1") is None
+    
+    def test_invalidate_publishes_keys(self):
+        """Invalidated keys are published on the invalidation channel."""
+        bus = CacheInvalidationBus(InMemoryCache())
+        bus._client = Mock()
+        
+        bus.invalidate("user:stats:1", "user:profile:1")
+        
+        bus._client.publish.assert_called_once_with(
+            CacheInvalidationBus.CHANNEL, '["user:stats:1", "user:profile:1"]'
+        )
+    
+    def test_received_message_drops_local_keys(self):
+        """Messages from other processes evict the keys locally."""
+        cache = InMemoryCache()
+        bus = CacheInvalidationBus(cache)
+        cache.set("user:stats:2", {"count": 2})
+        
+        bus._handle_message({"data": b'["user:stats:2"]'})
+        
+        assert cache.get("user:stats:2") is None
+
+
 class TestPerformanceMonitoring:
     """Test performance monitoring utilities."""
     
@@ -233,6 +366,49 @@ class TestCacheIntegration:
         
         # Stats should be different
         assert stats2["total_contributions"] == stats1["total_contributions"] + 1
+    
+    def test_filtered_issues_paginate_bulk_rows(self, db_session, bulk_issues):
+        """Test issue pagination over a bulk-inserted set."""
+        from app.schemas.issue import IssueFilters, PaginationParams
+        from app.services.issue_service import IssueService
+        
+        cache_service.delete_pattern(f"{IssueService.CACHE_PREFIX}*")
+        service = IssueService(db_session)
+        
+        issues, total = service.get_filtered_issues(
+            IssueFilters(repository_id=bulk_issues[0].repository_id),
+            PaginationParams(page=2, page_size=20)
+        )
+        
+        assert total == len(bulk_issues)
+        assert len(issues) == 20
+    
+    def test_response_cache_serves_raw_body(self):
+        """Test the response cache replays the stored JSON body unchanged."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from app.core.cache_middleware import ResponseCacheMiddleware
+        
+        cache_service.delete_pattern("api:response:*")
+        app = FastAPI()
+        app.add_middleware(ResponseCacheMiddleware)
+        calls = []
+        
+        @app.get("/api/v1/issues")
+        def list_issues():
+            calls.append(1)
+            return {"items": [1, 2, 3]}
+        
+        client = TestClient(app)
+        miss = client.get("/api/v1/issues")
+        hit = client.get("/api/v1/issues")
+        
+        assert miss.headers["X-Cache"] == "MISS"
+        assert hit.headers["X-Cache"] == "HIT"
+        assert hit.headers["content-type"] == "application/json"
+        assert hit.content == miss.content
+        assert len(calls) == 1
+        cache_service.delete_pattern("api:response:*")
 
 
 @pytest.mark.benchmark
@@ -0,0 +1,207 @@
+"""
+Tests for the open pull request sweep
+"""
+import asyncio
+import pytest
+from datetime import datetime
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from app.tasks.pr_tasks import check_all_open_prs_task, update_pr_status_task
+from app.tasks.event_loop import get_event_loop, run_async
+from app.models.contribution import Contribution, ContributionStatus
+from app.models.issue import Issue, IssueStatus
+from app.schemas.github import GitHubPullRequest
+
+
+def _pull_request(number, state="open", merged=False):
+    """A GitHubPullRequest with just the fields the sweep reads"""
+    return GitHubPullRequest(
+        id=number,
+        number=number,
+        title=f"PR {number}",
+        state=state,
+        html_url=f"https://github.com/test-org/test-repo/pull/{number}",
+        user={},
+        head={},
+        base={},
+        merged=merged,
+        merged_at=datetime(2024, 1, 2) if merged else None,
+        created_at=datetime(2024, 1, 1)
+    )
+
+
+@pytest.fixture
+def other_issue(db_session, sample_repository):
+    """A second issue in the sample repository"""
+    issue = Issue(
+        github_issue_id=67891,
+        repository_id=sample_repository.id,
+        title="Fix flaky login test",
+        labels=["good first issue"],
+        status=IssueStatus.CLAIMED,
+        github_url="https://github.com/test-org/test-repo/issues/2"
+    )
+    db_session.add(issue)
+    db_session.commit()
+    return issue
+
+
+@pytest.fixture
+def make_contribution(db_session, sample_issue, test_user):
+    """Factory for submitted contributions pointing at a PR number"""
+    def make(pr_number, issue=None, pr_url=None):
+        contribution = Contribution(
+            user_id=test_user.id,
+            issue_id=(issue or sample_issue).id,
+            pr_url=pr_url or f"https://github.com/test-org/test-repo/pull/{pr_number}",
+            pr_number=pr_number,
+            status=ContributionStatus.SUBMITTED
+        )
+        db_session.add(contribution)
+        db_session.commit()
+        return contribution.id
+    return make
+
+
+@pytest.fixture
+def pull_requests(db_session):
+    """
+    Run the tasks on the test session against a mocked GitHubService.
+
+    Yields a dict of PR number to pull request; numbers missing from it
+    are reported by GitHub as not found. The mocked service is under
+    the "service" key.
+    """
+    prs = {}
+    service = MagicMock()
+    service.get_pull_request = AsyncMock(side_effect=lambda repo, number: prs.get(number))
+    with patch('app.tasks.pr_tasks.SessionLocal', return_value=db_session), \
+         patch('app.tasks.pr_tasks.get_github_service', return_value=service):
+        prs["service"] = service
+        yield prs
+
+
+class TestCheckAllOpenPRsTask:
+    """Tests for check_all_open_prs_task"""
+    
+    def test_status_changes_are_applied(self, db_session, make_contribution, other_issue, pull_requests):
+        """Test merged, closed and open PRs update their contributions"""
+        merged_id = make_contribution(1)
+        closed_id = make_contribution(2, issue=other_issue)
+        open_id = make_contribution(3, issue=other_issue)
+        pull_requests[1] = _pull_request(1, state="closed", merged=True)
+        pull_requests[2] = _pull_request(2, state="closed")
+        pull_requests[3] = _pull_request(3)
+        
+        result = check_all_open_prs_task()
+        
+        assert result["success"] is True
+        assert result["total_checked"] == 3
+        assert result["updated_count"] == 2
+        assert result["merged_count"] == 1
+        assert result["closed_count"] == 1
+        assert result["errors"] == []
+        
+        # The task closes its session, so reload rows rather than refresh
+        merged = db_session.get(Contribution, merged_id)
+        assert merged.status == ContributionStatus.MERGED
+        assert merged.merged_at is not None
+        assert db_session.get(Contribution, closed_id).status == ContributionStatus.CLOSED
+        assert db_session.get(Contribution, open_id).status == ContributionStatus.SUBMITTED
+    
+    def test_merged_pr_completes_issue(self, db_session, sample_issue, make_contribution, other_issue, pull_requests):
+        """Test only the merged contribution's issue is marked completed"""
+        make_contribution(1)
+        make_contribution(2, issue=other_issue)
+        pull_requests[1] = _pull_request(1, state="closed", merged=True)
+        pull_requests[2] = _pull_request(2, state="closed")
+        merged_issue_id, closed_issue_id = sample_issue.id, other_issue.id
+        
+        check_all_open_prs_task()
+        
+        assert db_session.get(Issue, merged_issue_id).status == IssueStatus.COMPLETED
+        assert db_session.get(Issue, closed_issue_id).status == IssueStatus.CLAIMED
+    
+    def test_failed_checks_are_reported(self, db_session, make_contribution, pull_requests):
+        """Test a bad URL and a missing PR land in errors without stopping the sweep"""
+        bad_url_id = make_contribution(1, pr_url="https://example.com/not-a-pr")
+        missing_id = make_contribution(2)
+        merged_id = make_contribution(3)
+        pull_requests[3] = _pull_request(3, state="closed", merged=True)
+        
+        result = check_all_open_prs_task()
+        
+        assert result["success"] is True
+        assert result["total_checked"] == 3
+        assert result["merged_count"] == 1
+        assert len(result["errors"]) == 2
+        assert any(f"Contribution {bad_url_id}:" in e and "Invalid PR URL" in e for e in result["errors"])
+        assert any(f"Contribution {missing_id}:" in e and "not found" in e for e in result["errors"])
+        assert db_session.get(Contribution, merged_id).status == ContributionStatus.MERGED
+    
+    def test_timed_out_check_is_reported(self, db_session, make_contribution, pull_requests):
+        """Test a hung GitHub request is cut off and reported as a timeout"""
+        contribution_id = make_contribution(1)
+        
+        async def hang(repo, number):
+            await asyncio.sleep(1)
+        
+        pull_requests["service"].get_pull_request.side_effect = hang
+        with patch('app.tasks.pr_tasks.PR_CHECK_TIMEOUT_SECONDS', 0.01):
+            result = check_all_open_prs_task()
+        
+        assert result["success"] is True
+        assert result["errors"] == [f"Contribution {contribution_id}: timed out"]
+        assert db_session.get(Contribution, contribution_id).status == ContributionStatus.SUBMITTED
+    
+    def test_shared_pr_is_fetched_once(self, make_contribution, other_issue, pull_requests):
+        """Test contributions on the same PR share one GitHub request per sweep"""
+        make_contribution(7)
+        make_contribution(7, issue=other_issue)
+        pull_requests[7] = _pull_request(7, state="closed")
+        
+        result = check_all_open_prs_task()
+        
+        assert result["total_checked"] == 2
+        assert result["closed_count"] == 2
+        pull_requests["service"].get_pull_request.assert_awaited_once_with("test-org/test-repo", 7)
+    
+    def test_no_open_prs(self, pull_requests):
+        """Test an empty sweep checks nothing"""
+        result = check_all_open_prs_task()
+        
+        assert result["success"] is True
+        assert result["total_checked"] == 0
+        pull_requests["service"].get_pull_request.assert_not_awaited()
+
+
+class TestUpdatePRStatusTask:
+    """Tests for update_pr_status_task"""
+    
+    def test_single_update_always_fetches(self, db_session, make_contribution, pull_requests):
+        """Test single-PR updates bypass the sweep's PR memo"""
+        contribution_id = make_contribution(1)
+        pull_requests[1] = _pull_request(1)
+        update_pr_status_task(contribution_id)
+        pull_requests[1] = _pull_request(1, state="closed", merged=True)
+        
+        result = update_pr_status_task(contribution_id)
+        
+        assert result["success"] is True
+        assert result["new_status"] == ContributionStatus.MERGED.value
+        assert pull_requests["service"].get_pull_request.await_count == 2
+
+
+class TestRunAsync:
+    """Tests for the per-thread task event loop"""
+    
+    def test_loop_is_reused_between_runs(self):
+        """Test consecutive runs share one open loop"""
+        async def current_loop():
+            return asyncio.get_running_loop()
+        
+        first = run_async(current_loop())
+        second = run_async(current_loop())
+        
+        assert first is second is get_event_loop()
+        assert not first.is_closed()
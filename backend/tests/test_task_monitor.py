@@ -0,0 +1,63 @@
+"""
+Tests for task monitor stats sharing
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+
+from app.core.config import settings
+from app.tasks.monitoring import TaskMonitor, task_monitor
+
+
+@pytest.fixture
+def redis_client():
+    """Redis client already holding another process's stats for a task"""
+    client = MagicMock()
+    client.scan_iter.return_value = [b"task:stats:test:sync_task"]
+    client.pipeline.return_value.execute.return_value = [
+        {b"total_runs": b"40", b"successful_runs": b"40", b"total_duration": b"12.0"}
+    ]
+    with patch('app.tasks.monitoring.get_redis_client', return_value=client):
+        yield client
+
+
+class TestTaskMonitorSharing:
+    """Tests for opt-in shared task stats"""
+    
+    def test_new_monitor_starts_empty(self, redis_client):
+        """Test a default monitor ignores, and doesn't write, shared stats"""
+        monitor = TaskMonitor()
+        
+        assert monitor.get_task_stats() == {}
+        
+        monitor.record_task_execution("sync_task", success=True, duration_seconds=1.0)
+        
+        assert monitor.get_task_stats("sync_task")["total_runs"] == 1
+        redis_client.pipeline.assert_not_called()
+    
+    def test_shared_monitor_records_under_prefix_with_ttl(self, redis_client):
+        """Test a shared monitor writes its deployment's key and refreshes the TTL"""
+        monitor = TaskMonitor(shared=True, key_prefix="task:stats:test:")
+        
+        monitor.record_task_execution("sync_task", success=True, duration_seconds=1.0)
+        
+        pipe = redis_client.pipeline.return_value
+        pipe.hincrby.assert_any_call("task:stats:test:sync_task", "total_runs", 1)
+        pipe.expire.assert_called_once_with(
+            "task:stats:test:sync_task", TaskMonitor.SHARED_STATS_TTL_SECONDS
+        )
+        redis_client.scan_iter.assert_not_called()
+    
+    def test_shared_monitor_reads_its_prefix(self, redis_client):
+        """Test a shared monitor reports the totals stored under its prefix"""
+        monitor = TaskMonitor(shared=True, key_prefix="task:stats:test:")
+        
+        stats = monitor.get_task_stats("sync_task")
+        
+        redis_client.scan_iter.assert_called_once_with(match="task:stats:test:*", count=100)
+        assert stats["total_runs"] == 40
+    
+    def test_global_monitor_is_shared_when_redis_is_configured(self):
+        """Test the module-level monitor shares stats whenever REDIS_URL is set"""
+        assert settings.REDIS_URL
+        assert task_monitor.shared is True
+        assert task_monitor.key_prefix == f"task:stats:{settings.ENVIRONMENT}:"
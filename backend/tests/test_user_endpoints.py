@@ -37,9 +37,9 @@ def sample_user():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def auth_headers():
-    """Mock authentication headers with valid JWT token"""
+    """Mock authentication headers with valid JWT token, signed once per module"""
     from app.core.security import create_access_token
     
     token = create_access_token({
@@ -0,0 +1,76 @@
+"""
+Tests for user mutation commits
+"""
+import pytest
+from unittest.mock import patch
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
+from app.services.user_service import UserService
+from app.schemas.user import UserUpdate
+
+
+@pytest.fixture
+def statements(db_session):
+    """SQL statements executed on the test connection while the test runs"""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    connection = db_session.get_bind()
+    event.listen(connection, "before_cursor_execute", record)
+    yield executed
+    event.remove(connection, "before_cursor_execute", record)
+
+
+class TestCommitKeepLoaded:
+    """Tests for UserService._commit_keep_loaded"""
+    
+    def test_plain_commit_expires_user(self, db_session, test_user, statements):
+        """Test the session expires instances on commit, so a read reloads them"""
+        test_user.bio = "Changed"
+        db_session.commit()
+        statements.clear()
+        
+        assert test_user.bio == "Changed"
+        assert any(s.lstrip().upper().startswith("SELECT") for s in statements)
+    
+    def test_updated_user_stays_loaded(self, db_session, test_user, statements):
+        """Test the returned user is readable without a refresh SELECT"""
+        service = UserService(db_session)
+        user = service.update_preferences(
+            test_user.id, UserUpdate(preferred_languages=["Go"], preferred_labels=["bug"])
+        )
+        statements.clear()
+        
+        assert user.preferred_languages == ["Go"]
+        assert user.preferred_labels == ["bug"]
+        assert user.github_username == test_user.github_username
+        assert user.updated_at is not None
+        assert statements == []
+    
+    def test_expire_on_commit_is_restored(self, db_session, test_user):
+        """Test the override is limited to the one commit"""
+        assert db_session.expire_on_commit is True
+        service = UserService(db_session)
+        
+        service.update_preferences(test_user.id, UserUpdate(preferred_languages=["Go"]))
+        
+        assert db_session.expire_on_commit is True
+    
+    def test_expire_on_commit_is_restored_when_commit_fails(self, db_session):
+        """Test a failed commit still restores expire_on_commit"""
+        seen = []
+        
+        def failing_commit():
+            seen.append(db_session.expire_on_commit)
+            raise OperationalError("COMMIT", {}, Exception("connection lost"))
+        
+        service = UserService(db_session)
+        with patch.object(db_session, 'commit', side_effect=failing_commit):
+            with pytest.raises(OperationalError):
+                service._commit_keep_loaded()
+        
+        assert seen == [False]
+        assert db_session.expire_on_commit is True
@@ -30,14 +30,14 @@ class TestUserStatistics:
     
     def test_calculate_stats_with_contributions(
         self,
-        db: Session,
+        db_session: Session,
         test_user: User,
         test_repository: Repository
     ):
         """Test statistics calculation with contributions"""
         # Create 5 contributions
-        for i in range(5):
-            issue = Issue(
+        issues = [
+            Issue(
                 github_issue_id=7000 + i,
                 repository_id=test_repository.id,
                 title=f"Stats Test Issue {i}",
@@ -47,24 +47,29 @@ class TestUserStatistics:
                 status=IssueStatus.COMPLETED,
                 github_url=f"https://github.com/test/repo/issues/{i}"
             )
-            db.add(issue)
-            db.flush()
-            
-            contribution = Contribution(
+            for i in range(5)
+        ]
+        db_session.add_all(issues)
+        db_session.flush()
+        
+        merged_at = datetime.utcnow()
+        db_session.add_all([
+            Contribution(
                 user_id=test_user.id,
                 issue_id=issue.id,
                 pr_url=f"https://github.com/test/repo/pull/{i}",
                 pr_number=i,
                 status=ContributionStatus.MERGED if i < 3 else ContributionStatus.SUBMITTED,
-                merged_at=datetime.utcnow() if i < 3 else None,
+                merged_at=merged_at if i < 3 else None,
                 points_earned=100 if i < 3 else 10
             )
-            db.add(contribution)
+            for i, issue in enumerate(issues)
+        ])
         
         # Update user stats
         test_user.total_contributions = 5
         test_user.merged_prs = 3
-        db.commit()
+        db_session.commit()
         
         service = UserService(db_session)
         stats = service.get_user_stats(test_user.id, use_cache=False)
@@ -76,7 +81,7 @@ class TestUserStatistics:
     
     def test_contributions_by_language(
         self,
-        db: Session,
+        db_session: Session,
         test_user: User,
         test_repository: Repository
     ):
@@ -87,35 +92,40 @@ class TestUserStatistics:
             "TypeScript": 1
         }
         
-        issue_id = 8000
-        for language, count in languages.items():
-            for i in range(count):
-                issue = Issue(
-                    github_issue_id=issue_id,
-                    repository_id=test_repository.id,
-                    title=f"{language} Issue {i}",
-                    description="Test description",
-                    programming_language=language,
-                    difficulty_level="easy",
-                    status=IssueStatus.COMPLETED,
-                    github_url=f"https://github.com/test/repo/issues/{issue_id}"
-                )
-                db.add(issue)
-                db.flush()
-                
-                contribution = Contribution(
-                    user_id=test_user.id,
-                    issue_id=issue.id,
-                    pr_url=f"https://github.com/test/repo/pull/{issue_id}",
-                    pr_number=issue_id,
-                    status=ContributionStatus.MERGED,
-                    merged_at=datetime.utcnow(),
-                    points_earned=100
-                )
-                db.add(contribution)
-                issue_id += 1
-        
-        db.commit()
+        issue_languages = [
+            language for language, count in languages.items() for _ in range(count)
+        ]
+        issues = [
+            Issue(
+                github_issue_id=8000 + n,
+                repository_id=test_repository.id,
+                title=f"{language} Issue {n}",
+                description="Test description",
+                programming_language=language,
+                difficulty_level="easy",
+                status=IssueStatus.COMPLETED,
+                github_url=f"https://github.com/test/repo/issues/{8000 + n}"
+            )
+            for n, language in enumerate(issue_languages)
+        ]
+        db_session.add_all(issues)
+        db_session.flush()
+        
+        merged_at = datetime.utcnow()
+        db_session.add_all([
+            Contribution(
+                user_id=test_user.id,
+                issue_id=issue.id,
+                pr_url=f"https://github.com/test/repo/pull/{issue.github_issue_id}",
+                pr_number=issue.github_issue_id,
+                status=ContributionStatus.MERGED,
+                merged_at=merged_at,
+                points_earned=100
+            )
+            for issue in issues
+        ])
+        
+        db_session.commit()
         
         service = UserService(db_session)
         stats = service.get_user_stats(test_user.id, use_cache=False)
@@ -127,14 +137,13 @@ class TestUserStatistics:
     
     def test_contributions_by_repository(
         self,
-        db: Session,
+        db_session: Session,
         test_user: User
     ):
         """Test contributions grouped by repository"""
         # Create multiple repositories
-        repos = []
-        for i in range(3):
-            repo = Repository(
+        repos = [
+            Repository(
                 github_repo_id=90000 + i,
                 full_name=f"test/repo{i}",
                 name=f"repo{i}",
@@ -144,41 +153,45 @@ class TestUserStatistics:
                 forks=10,
                 is_active=True
             )
-            db.add(repo)
-            db.flush()
-            repos.append(repo)
+            for i in range(3)
+        ]
+        db_session.add_all(repos)
+        db_session.flush()
         
         # Create contributions across repositories
-        issue_id = 9000
-        for i, repo in enumerate(repos):
-            count = i + 1  # repo0: 1, repo1: 2, repo2: 3
-            for j in range(count):
-                issue = Issue(
-                    github_issue_id=issue_id,
-                    repository_id=repo.id,
-                    title=f"Issue {j} in {repo.full_name}",
-                    description="Test description",
-                    programming_language="Python",
-                    difficulty_level="easy",
-                    status=IssueStatus.COMPLETED,
-                    github_url=f"https://github.com/{repo.full_name}/issues/{issue_id}"
-                )
-                db.add(issue)
-                db.flush()
-                
-                contribution = Contribution(
-                    user_id=test_user.id,
-                    issue_id=issue.id,
-                    pr_url=f"https://github.com/{repo.full_name}/pull/{issue_id}",
-                    pr_number=issue_id,
-                    status=ContributionStatus.MERGED,
-                    merged_at=datetime.utcnow(),
-                    points_earned=100
-                )
-                db.add(contribution)
-                issue_id += 1
-        
-        db.commit()
+        # repo0: 1, repo1: 2, repo2: 3
+        issue_repos = [repo for i, repo in enumerate(repos) for _ in range(i + 1)]
+        issues = [
+            Issue(
+                github_issue_id=9000 + n,
+                repository_id=repo.id,
+                title=f"Issue {n} in {repo.full_name}",
+                description="Test description",
+                programming_language="Python",
+                difficulty_level="easy",
+                status=IssueStatus.COMPLETED,
+                github_url=f"https://github.com/{repo.full_name}/issues/{9000 + n}"
+            )
+            for n, repo in enumerate(issue_repos)
+        ]
+        db_session.add_all(issues)
+        db_session.flush()
+        
+        merged_at = datetime.utcnow()
+        db_session.add_all([
+            Contribution(
+                user_id=test_user.id,
+                issue_id=issue.id,
+                pr_url=f"https://github.com/{repo.full_name}/pull/{issue.github_issue_id}",
+                pr_number=issue.github_issue_id,
+                status=ContributionStatus.MERGED,
+                merged_at=merged_at,
+                points_earned=100
+            )
+            for issue, repo in zip(issues, issue_repos)
+        ])
+        
+        db_session.commit()
         
         service = UserService(db_session)
         stats = service.get_user_stats(test_user.id, use_cache=False)
@@ -190,14 +203,14 @@ class TestUserStatistics:
     
     def test_recent_contributions_limit(
         self,
-        db: Session,
+        db_session: Session,
         test_user: User,
         test_repository: Repository
     ):
         """Test recent contributions are limited to 10"""
         # Create 15 contributions
-        for i in range(15):
-            issue = Issue(
+        issues = [
+            Issue(
                 github_issue_id=10000 + i,
                 repository_id=test_repository.id,
                 title=f"Recent Test Issue {i}",
@@ -207,21 +220,26 @@ class TestUserStatistics:
                 status=IssueStatus.COMPLETED,
                 github_url=f"https://github.com/test/repo/issues/{i}"
             )
-            db.add(issue)
-            db.flush()
-            
-            contribution = Contribution(
+            for i in range(15)
+        ]
+        db_session.add_all(issues)
+        db_session.flush()
+        
+        merged_at = datetime.utcnow()
+        db_session.add_all([
+            Contribution(
                 user_id=test_user.id,
                 issue_id=issue.id,
                 pr_url=f"https://github.com/test/repo/pull/{i}",
                 pr_number=i,
                 status=ContributionStatus.MERGED,
-                merged_at=datetime.utcnow(),
+                merged_at=merged_at,
                 points_earned=100
             )
-            db.add(contribution)
+            for i, issue in enumerate(issues)
+        ])
         
-        db.commit()
+        db_session.commit()
         
         service = UserService(db_session)
         stats = service.get_user_stats(test_user.id, use_cache=False)
@@ -231,15 +249,14 @@ class TestUserStatistics:
     
     def test_recent_contributions_order(
         self,
-        db: Session,
+        db_session: Session,
         test_user: User,
         test_repository: Repository
     ):
         """Test recent contributions are ordered by submission date"""
         # Create contributions with different timestamps
-        contributions = []
-        for i in range(5):
-            issue = Issue(
+        issues = [
+            Issue(
                 github_issue_id=11000 + i,
                 repository_id=test_repository.id,
                 title=f"Order Test Issue {i}",
@@ -249,22 +266,27 @@ class TestUserStatistics:
                 status=IssueStatus.COMPLETED,
                 github_url=f"https://github.com/test/repo/issues/{i}"
             )
-            db.add(issue)
-            db.flush()
-            
-            contribution = Contribution(
+            for i in range(5)
+        ]
+        db_session.add_all(issues)
+        db_session.flush()
+        
+        merged_at = datetime.utcnow()
+        contributions = [
+            Contribution(
                 user_id=test_user.id,
                 issue_id=issue.id,
                 pr_url=f"https://github.com/test/repo/pull/{i}",
                 pr_number=i,
                 status=ContributionStatus.MERGED,
-                merged_at=datetime.utcnow(),
+                merged_at=merged_at,
                 points_earned=100
             )
-            db.add(contribution)
-            contributions.append(contribution)
+            for i, issue in enumerate(issues)
+        ]
+        db_session.add_all(contributions)
         
-        db.commit()
+        db_session.commit()
         
         service = UserService(db_session)
         stats = service.get_user_stats(test_user.id, use_cache=False)
@@ -284,7 +306,7 @@ class TestUserStatistics:
         initial_count = test_user.total_contributions
         service.increment_contribution_count(test_user.id)
         
-        db.refresh(test_user)
+        db_session.refresh(test_user)
         assert test_user.total_contributions == initial_count + 1
     
     def test_increment_merged_pr_count(self, db_session: Session, test_user: User):
@@ -294,12 +316,12 @@ class TestUserStatistics:
         initial_count = test_user.merged_prs
         service.increment_merged_pr_count(test_user.id)
         
-        db.refresh(test_user)
+        db_session.refresh(test_user)
         assert test_user.merged_prs == initial_count + 1
     
     def test_stats_only_count_verified_contributions(
         self,
-        db: Session,
+        db_session: Session,
         test_user: User,
         test_repository: Repository
     ):
@@ -322,8 +344,8 @@ class TestUserStatistics:
                 status=IssueStatus.COMPLETED,
                 github_url=f"https://github.com/test/repo/issues/{i}"
             )
-            db.add(issue)
-            db.flush()
+            db_session.add(issue)
+            db_session.flush()
             
             contribution = Contribution(
                 user_id=test_user.id,
@@ -334,9 +356,9 @@ class TestUserStatistics:
                 merged_at=datetime.utcnow() if status == ContributionStatus.MERGED else None,
                 points_earned=100 if status == ContributionStatus.MERGED else 10
             )
-            db.add(contribution)
+            db_session.add(contribution)
         
-        db.commit()
+        db_session.commit()
         
         service = UserService(db_session)
         stats = service.get_user_stats(test_user.id, use_cache=False)
@@ -360,9 +382,8 @@ def test_user(db_session: Session) -> User:
         total_contributions=0,
         merged_prs=0
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    db_session.add(user)
+    db_session.commit()
     return user
 
 
@@ -379,7 +400,6 @@ def test_repository(db_session: Session) -> Repository:
         forks=15,
         is_active=True
     )
-    db.add(repo)
-    db.commit()
-    db.refresh(repo)
+    db_session.add(repo)
+    db_session.commit()
     return repo